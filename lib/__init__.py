@@ -1,184 +1,249 @@
+import importlib
+import importlib.util
+import sys
+
 import bpy
 
-from .configs.audio_source import AC_AudioSource
-from .configs.grassfx import AC_GrassFX, AC_GrassFXMaterial, AC_GrassFXOccludingMaterial
-from .configs.kn5 import (AC_MaterialSettings, AC_ShaderProperty,
-                          AC_TextureSettings)
-from .configs.lighting import (AC_CSPLightSettings, AC_DirectionList, AC_EmissiveMaterial,
-                               AC_GlobalLighting, AC_Light, AC_Lighting, AC_MaterialList,
-                               AC_MeshList, AC_PositionList, AC_SunSettings)
-from .configs.rainfx import AC_RainFX
-from .configs.surface import AC_Surface
-from .configs.track import AC_Track
-from .gizmos.pitbox import (AC_GizmoGate, AC_GizmoGroup,
-                            AC_GizmoPitbox, AC_GizmoStartPos, AC_SelectGizmoObject)
-from .menus.context import (WM_MT_AssignSurface, WM_MT_ObjectSetup,
-                            surface_menu)
-from .menus.ops.audio import AC_AddAudioSource, AC_ToggleAudio
-from .menus.ops.extensions import (AC_AddGlobalExtension,
-                                   AC_AddGlobalExtensionItem,
-                                   AC_RemoveGlobalExtension,
-                                   AC_RemoveGlobalExtensionItem,
-                                   AC_ToggleGlobalExtension)
-from .menus.ops.object_setup import (AC_AutoSetupObjects, AC_SetupAsGrass,
-                                     AC_SetupAsStandard, AC_SetupAsTree)
-from .menus.ops.image_generation import (AC_CreatePreviewCamera,
-                                         AC_GenerateMap, AC_GeneratePreview)
-from .menus.ops.project import (AC_AddABFinishGate, AC_AddABStartGate,
-                                AC_AddAudioEmitter, AC_AddHotlapStart,
-                                AC_AddPitbox, AC_AddStart, AC_AddTimeGate,
-                                AC_AddRaceSetup,
-                                AC_AutofixPreflight,
-                                AC_SaveSettings, AC_ValidateAll, AC_UpdateMaterialConfig,
-                                AC_SaveSurfaces, AC_SaveExtensions, AC_SaveLighting,
-                                AC_SaveAudio, AC_SaveTrackData, AC_ScanForIssues, AC_ShowPreflightErrors)
-from .menus.ops.surface import (AC_AddSurface, AC_AddSurfaceExt,
-                                AC_AssignPhysProp, AC_AssignSurface,
-                                AC_AssignWall, AC_DeleteSurfaceExt,
-                                AC_InitSurfaces, AC_RefreshSurfaces, AC_RemoveSurface,
-                                AC_SelectAllSurfaces, AC_ToggleSurface)
-from .menus.ops.track import (AC_AddGeoTag, AC_AddTag, AC_RemoveGeoTag,
-                              AC_RemoveTag, AC_SelectByName, AC_ToggleGeoTag,
-                              AC_ToggleTag)
-from .menus.ops.material_setup import (AC_AutoAssignTextureSlots, AC_SetupNormalMap, AC_ApplyShaderDefaults, AC_ResetShaderDefaults)
-from .menus.ops.grassfx import (AC_AddGrassFXMaterial, AC_RemoveGrassFXMaterial,
-                                AC_ClearGrassFXMaterials, AC_AutoDetectGrassFXMaterials,
-                                AC_AddOccludingMaterial, AC_RemoveOccludingMaterial,
-                                AC_ClearOccludingMaterials)
-from .menus.ops.lighting import (AC_AddLight, AC_AddLightFromSelection, AC_AddLightAtCursor,
-                                 AC_RemoveLight, AC_ToggleLightShadows, AC_DuplicateLight, AC_SyncLightFromObject,
-                                 AC_SyncAllLights, AC_SelectLightObject,
-                                 AC_MoveLightUp, AC_MoveLightDown,
-                                 AC_AddBlenderSpotLight, AC_SyncFromBlenderLight, AC_AddLightFromBlenderLights,
-                                 AC_ScanLights, AC_SyncAllFromBlender, AC_ExportAndUpdateLights,
-                                 AC_AddEmissiveMaterial, AC_AddEmissiveFromMesh, AC_RemoveEmissiveMaterial,
-                                 AC_ToggleEmissiveShadows, AC_ClearEmissiveMaterials, AC_SelectEmissiveObject)
-from .menus.ops.rainfx import (AC_AutoDetectRainFXMaterials, AC_ClearRainFXMaterials,
-                               AC_ToggleRainFX)
-from .menus.ops.treefx import AC_ExportTreeList
-from .menus.ops.sync import (AC_ExtConfigSyncCheck, AC_ExtConfigSyncDialog,
-                              AC_ExtConfigSyncAction, AC_ExtConfigSyncCancel,
-                              AC_ExtConfigViewDiff, AC_ImportExtConfig)
-from .configs.bulk_edit import (AC_BulkMaterialItem, AC_BulkPropertyValue,
-                                 AC_BulkEditSettings)
-from .menus.ops.bulk_edit import (AC_UL_BulkMaterials, AC_BulkEditSelectMaterials,
-                                   AC_BulkEditToggleAll, AC_BulkEditToggleNone,
-                                   AC_BulkEditProperties)
-from .ai import AC_ExportAILine
-from .ai import ai_ops as ai_ops_module
-from .menus.panels import (AC_AddShaderProperty, AC_RemoveShaderProperty,
-                           AC_UL_ShaderProperties, NODE_PT_AC_Texture,
-                           PROPERTIES_PT_AC_Material)
-from .menus.sidebar import (AC_UL_Extensions,
-                            AC_UL_SurfaceExtensions, AC_UL_Tags,
-                            AC_UL_GrassFXMaterials, AC_UL_Materials,
-                            AC_UL_Lights, AC_UL_EmissiveMaterials,
-                            AC_ClearMaterialSearch, AC_ScanMaterials,
-                            VIEW3D_PT_AC_Setup,
-                            VIEW3D_PT_AC_SurfaceTools,
-                            VIEW3D_PT_AC_Surfaces,
-                            VIEW3D_PT_AC_Objects,
-                            VIEW3D_PT_AC_TrackImages,
-                            VIEW3D_PT_AC_Export,
-                            VIEW3D_PT_AC_Sidebar_Extra,
-                            VIEW3D_PT_AC_Sidebar_GrassFX,
-                            VIEW3D_PT_AC_Sidebar_RainFX,
-                            VIEW3D_PT_AC_Sidebar_TreeFX,
-                            VIEW3D_PT_AC_Sidebar_AILines,
-                            VIEW3D_PT_AC_Sidebar_CSPLights,
-                            VIEW3D_PT_AC_Sidebar_EmissiveMaterials,
-                            VIEW3D_PT_AC_MaterialEditor,
-                            VIEW3D_PT_AC_MaterialProperties,
-                            VIEW3D_PT_AC_ShaderProperties)
-from .settings import AC_Settings, ExportSettings, KN5_MeshSettings
-from .preferences import AC_Preferences
-from .kn5.exporter_ops import (
-    AC_ContinueSmartExport,
-    ReportOperator,
-    CopyClipboardButtonOperator,
-    ExportKN5,
-    menu_func,
-)
-from .kn5 import export_utils
-from .kn5.ui_properties import (
-    NodeProperties,
-    KN5_PT_NodePanel,
-    MaterialProperties,
-    TextureProperties,
-)
+# Public names re-exported by this package, mapped to the submodule that
+# defines them. Submodules are only imported when register() runs or when one
+# of these names is first accessed as an attribute of the package.
+_NAME_TO_MODULE = {
+    "AC_AudioSource": ".configs.audio_source",
+    "AC_GrassFX": ".configs.grassfx",
+    "AC_GrassFXMaterial": ".configs.grassfx",
+    "AC_GrassFXOccludingMaterial": ".configs.grassfx",
+    "AC_MaterialSettings": ".configs.kn5",
+    "AC_ShaderProperty": ".configs.kn5",
+    "AC_TextureSettings": ".configs.kn5",
+    "AC_CSPLightSettings": ".configs.lighting",
+    "AC_DirectionList": ".configs.lighting",
+    "AC_EmissiveMaterial": ".configs.lighting",
+    "AC_GlobalLighting": ".configs.lighting",
+    "AC_Light": ".configs.lighting",
+    "AC_Lighting": ".configs.lighting",
+    "AC_MaterialList": ".configs.lighting",
+    "AC_MeshList": ".configs.lighting",
+    "AC_PositionList": ".configs.lighting",
+    "AC_SunSettings": ".configs.lighting",
+    "AC_RainFX": ".configs.rainfx",
+    "AC_Surface": ".configs.surface",
+    "AC_Track": ".configs.track",
+    "AC_BulkMaterialItem": ".configs.bulk_edit",
+    "AC_BulkPropertyValue": ".configs.bulk_edit",
+    "AC_BulkEditSettings": ".configs.bulk_edit",
+    "AC_GizmoGate": ".gizmos.pitbox",
+    "AC_GizmoGroup": ".gizmos.pitbox",
+    "AC_GizmoPitbox": ".gizmos.pitbox",
+    "AC_GizmoStartPos": ".gizmos.pitbox",
+    "AC_SelectGizmoObject": ".gizmos.pitbox",
+    "WM_MT_AssignSurface": ".menus.context",
+    "WM_MT_ObjectSetup": ".menus.context",
+    "surface_menu": ".menus.context",
+    "AC_AddAudioSource": ".menus.ops.audio",
+    "AC_ToggleAudio": ".menus.ops.audio",
+    "AC_AddGlobalExtension": ".menus.ops.extensions",
+    "AC_AddGlobalExtensionItem": ".menus.ops.extensions",
+    "AC_RemoveGlobalExtension": ".menus.ops.extensions",
+    "AC_RemoveGlobalExtensionItem": ".menus.ops.extensions",
+    "AC_ToggleGlobalExtension": ".menus.ops.extensions",
+    "AC_AutoSetupObjects": ".menus.ops.object_setup",
+    "AC_SetupAsGrass": ".menus.ops.object_setup",
+    "AC_SetupAsStandard": ".menus.ops.object_setup",
+    "AC_SetupAsTree": ".menus.ops.object_setup",
+    "AC_CreatePreviewCamera": ".menus.ops.image_generation",
+    "AC_GenerateMap": ".menus.ops.image_generation",
+    "AC_GeneratePreview": ".menus.ops.image_generation",
+    "AC_AddABFinishGate": ".menus.ops.project",
+    "AC_AddABStartGate": ".menus.ops.project",
+    "AC_AddAudioEmitter": ".menus.ops.project",
+    "AC_AddHotlapStart": ".menus.ops.project",
+    "AC_AddPitbox": ".menus.ops.project",
+    "AC_AddStart": ".menus.ops.project",
+    "AC_AddTimeGate": ".menus.ops.project",
+    "AC_AddRaceSetup": ".menus.ops.project",
+    "AC_AutofixPreflight": ".menus.ops.project",
+    "AC_SaveSettings": ".menus.ops.project",
+    "AC_ValidateAll": ".menus.ops.project",
+    "AC_UpdateMaterialConfig": ".menus.ops.project",
+    "AC_SaveSurfaces": ".menus.ops.project",
+    "AC_SaveExtensions": ".menus.ops.project",
+    "AC_SaveLighting": ".menus.ops.project",
+    "AC_SaveAudio": ".menus.ops.project",
+    "AC_SaveTrackData": ".menus.ops.project",
+    "AC_ScanForIssues": ".menus.ops.project",
+    "AC_ShowPreflightErrors": ".menus.ops.project",
+    "AC_AddSurface": ".menus.ops.surface",
+    "AC_AddSurfaceExt": ".menus.ops.surface",
+    "AC_AssignPhysProp": ".menus.ops.surface",
+    "AC_AssignSurface": ".menus.ops.surface",
+    "AC_AssignWall": ".menus.ops.surface",
+    "AC_DeleteSurfaceExt": ".menus.ops.surface",
+    "AC_InitSurfaces": ".menus.ops.surface",
+    "AC_RefreshSurfaces": ".menus.ops.surface",
+    "AC_RemoveSurface": ".menus.ops.surface",
+    "AC_SelectAllSurfaces": ".menus.ops.surface",
+    "AC_ToggleSurface": ".menus.ops.surface",
+    "AC_AddGeoTag": ".menus.ops.track",
+    "AC_AddTag": ".menus.ops.track",
+    "AC_RemoveGeoTag": ".menus.ops.track",
+    "AC_RemoveTag": ".menus.ops.track",
+    "AC_SelectByName": ".menus.ops.track",
+    "AC_ToggleGeoTag": ".menus.ops.track",
+    "AC_ToggleTag": ".menus.ops.track",
+    "AC_AutoAssignTextureSlots": ".menus.ops.material_setup",
+    "AC_SetupNormalMap": ".menus.ops.material_setup",
+    "AC_ApplyShaderDefaults": ".menus.ops.material_setup",
+    "AC_ResetShaderDefaults": ".menus.ops.material_setup",
+    "AC_AddGrassFXMaterial": ".menus.ops.grassfx",
+    "AC_RemoveGrassFXMaterial": ".menus.ops.grassfx",
+    "AC_ClearGrassFXMaterials": ".menus.ops.grassfx",
+    "AC_AutoDetectGrassFXMaterials": ".menus.ops.grassfx",
+    "AC_AddOccludingMaterial": ".menus.ops.grassfx",
+    "AC_RemoveOccludingMaterial": ".menus.ops.grassfx",
+    "AC_ClearOccludingMaterials": ".menus.ops.grassfx",
+    "AC_AddLight": ".menus.ops.lighting",
+    "AC_AddLightFromSelection": ".menus.ops.lighting",
+    "AC_AddLightAtCursor": ".menus.ops.lighting",
+    "AC_RemoveLight": ".menus.ops.lighting",
+    "AC_ToggleLightShadows": ".menus.ops.lighting",
+    "AC_DuplicateLight": ".menus.ops.lighting",
+    "AC_SyncLightFromObject": ".menus.ops.lighting",
+    "AC_SyncAllLights": ".menus.ops.lighting",
+    "AC_SelectLightObject": ".menus.ops.lighting",
+    "AC_MoveLightUp": ".menus.ops.lighting",
+    "AC_MoveLightDown": ".menus.ops.lighting",
+    "AC_AddBlenderSpotLight": ".menus.ops.lighting",
+    "AC_SyncFromBlenderLight": ".menus.ops.lighting",
+    "AC_AddLightFromBlenderLights": ".menus.ops.lighting",
+    "AC_ScanLights": ".menus.ops.lighting",
+    "AC_SyncAllFromBlender": ".menus.ops.lighting",
+    "AC_ExportAndUpdateLights": ".menus.ops.lighting",
+    "AC_AddEmissiveMaterial": ".menus.ops.lighting",
+    "AC_AddEmissiveFromMesh": ".menus.ops.lighting",
+    "AC_RemoveEmissiveMaterial": ".menus.ops.lighting",
+    "AC_ToggleEmissiveShadows": ".menus.ops.lighting",
+    "AC_ClearEmissiveMaterials": ".menus.ops.lighting",
+    "AC_SelectEmissiveObject": ".menus.ops.lighting",
+    "AC_AutoDetectRainFXMaterials": ".menus.ops.rainfx",
+    "AC_ClearRainFXMaterials": ".menus.ops.rainfx",
+    "AC_ToggleRainFX": ".menus.ops.rainfx",
+    "AC_ExportTreeList": ".menus.ops.treefx",
+    "AC_ExtConfigSyncCheck": ".menus.ops.sync",
+    "AC_ExtConfigSyncDialog": ".menus.ops.sync",
+    "AC_ExtConfigSyncAction": ".menus.ops.sync",
+    "AC_ExtConfigSyncCancel": ".menus.ops.sync",
+    "AC_ExtConfigViewDiff": ".menus.ops.sync",
+    "AC_ImportExtConfig": ".menus.ops.sync",
+    "AC_UL_BulkMaterials": ".menus.ops.bulk_edit",
+    "AC_BulkEditSelectMaterials": ".menus.ops.bulk_edit",
+    "AC_BulkEditToggleAll": ".menus.ops.bulk_edit",
+    "AC_BulkEditToggleNone": ".menus.ops.bulk_edit",
+    "AC_BulkEditProperties": ".menus.ops.bulk_edit",
+    "AC_ExportAILine": ".ai.ai_ops",
+    "AC_AddShaderProperty": ".menus.panels",
+    "AC_RemoveShaderProperty": ".menus.panels",
+    "AC_UL_ShaderProperties": ".menus.panels",
+    "NODE_PT_AC_Texture": ".menus.panels",
+    "PROPERTIES_PT_AC_Material": ".menus.panels",
+    "AC_UL_Extensions": ".menus.sidebar",
+    "AC_UL_SurfaceExtensions": ".menus.sidebar",
+    "AC_UL_Tags": ".menus.sidebar",
+    "AC_UL_GrassFXMaterials": ".menus.sidebar",
+    "AC_UL_Materials": ".menus.sidebar",
+    "AC_UL_Lights": ".menus.sidebar",
+    "AC_UL_EmissiveMaterials": ".menus.sidebar",
+    "AC_ClearMaterialSearch": ".menus.sidebar",
+    "AC_ScanMaterials": ".menus.sidebar",
+    "VIEW3D_PT_AC_Setup": ".menus.sidebar",
+    "VIEW3D_PT_AC_SurfaceTools": ".menus.sidebar",
+    "VIEW3D_PT_AC_Surfaces": ".menus.sidebar",
+    "VIEW3D_PT_AC_Objects": ".menus.sidebar",
+    "VIEW3D_PT_AC_TrackImages": ".menus.sidebar",
+    "VIEW3D_PT_AC_Export": ".menus.sidebar",
+    "VIEW3D_PT_AC_Sidebar_Extra": ".menus.sidebar",
+    "VIEW3D_PT_AC_Sidebar_GrassFX": ".menus.sidebar",
+    "VIEW3D_PT_AC_Sidebar_RainFX": ".menus.sidebar",
+    "VIEW3D_PT_AC_Sidebar_TreeFX": ".menus.sidebar",
+    "VIEW3D_PT_AC_Sidebar_AILines": ".menus.sidebar",
+    "VIEW3D_PT_AC_Sidebar_CSPLights": ".menus.sidebar",
+    "VIEW3D_PT_AC_Sidebar_EmissiveMaterials": ".menus.sidebar",
+    "VIEW3D_PT_AC_MaterialEditor": ".menus.sidebar",
+    "VIEW3D_PT_AC_MaterialProperties": ".menus.sidebar",
+    "VIEW3D_PT_AC_ShaderProperties": ".menus.sidebar",
+    "AC_Settings": ".settings",
+    "ExportSettings": ".settings",
+    "KN5_MeshSettings": ".settings",
+    "AC_Preferences": ".preferences",
+    "AC_ContinueSmartExport": ".kn5.exporter_ops",
+    "ReportOperator": ".kn5.exporter_ops",
+    "CopyClipboardButtonOperator": ".kn5.exporter_ops",
+    "ExportKN5": ".kn5.exporter_ops",
+    "menu_func": ".kn5.exporter_ops",
+    "NodeProperties": ".kn5.ui_properties",
+    "KN5_PT_NodePanel": ".kn5.ui_properties",
+    "MaterialProperties": ".kn5.ui_properties",
+    "TextureProperties": ".kn5.ui_properties",
+}
+
+
+def __getattr__(name):
+    """Resolve re-exported names on first access (PEP 562)."""
+    module_name = _NAME_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
 
-__classes__ = (
-    AC_InitSurfaces, AC_RefreshSurfaces, AC_AddSurface, AC_RemoveSurface, AC_ToggleSurface, AC_AssignSurface, AC_SelectAllSurfaces, AC_AssignWall, AC_AssignPhysProp,
-    AC_AddSurfaceExt, AC_DeleteSurfaceExt,
-    AC_AddTag, AC_RemoveTag, AC_AddGeoTag, AC_RemoveGeoTag, AC_ToggleTag, AC_ToggleGeoTag,
-    AC_AutofixPreflight, AC_ValidateAll, AC_UpdateMaterialConfig, AC_ScanForIssues, AC_ShowPreflightErrors,
-    AC_SaveSettings,
-    AC_SaveSurfaces, AC_SaveExtensions, AC_SaveLighting, AC_SaveAudio, AC_SaveTrackData,
-    AC_SelectByName,
-    AC_SelectGizmoObject, AC_GizmoPitbox, AC_GizmoStartPos, AC_GizmoGate, AC_GizmoGroup,
-    AC_AddAudioSource, AC_ToggleAudio,
-    AC_AddGlobalExtension, AC_RemoveGlobalExtension, AC_ToggleGlobalExtension, AC_AddGlobalExtensionItem, AC_RemoveGlobalExtensionItem,
-    AC_AddStart, AC_AddHotlapStart, AC_AddPitbox, AC_AddTimeGate, AC_AddABStartGate, AC_AddABFinishGate, AC_AddAudioEmitter, AC_AddRaceSetup,
-    AC_SetupAsGrass, AC_SetupAsStandard, AC_SetupAsTree, AC_AutoSetupObjects,
-    AC_AddShaderProperty, AC_RemoveShaderProperty,
-    AC_AutoAssignTextureSlots, AC_SetupNormalMap, AC_ApplyShaderDefaults, AC_ResetShaderDefaults,
-    AC_ClearMaterialSearch, AC_ScanMaterials,
-    AC_AddGrassFXMaterial, AC_RemoveGrassFXMaterial, AC_ClearGrassFXMaterials, AC_AutoDetectGrassFXMaterials,
-    AC_AddOccludingMaterial, AC_RemoveOccludingMaterial, AC_ClearOccludingMaterials,
-    AC_AutoDetectRainFXMaterials, AC_ClearRainFXMaterials, AC_ToggleRainFX,
-    AC_ExportTreeList,
-    AC_ExportAILine,
-    AC_ExtConfigSyncCheck, AC_ExtConfigSyncDialog, AC_ExtConfigSyncAction, AC_ExtConfigSyncCancel, AC_ExtConfigViewDiff, AC_ImportExtConfig,
-    AC_AddLight, AC_AddLightFromSelection, AC_AddLightAtCursor, AC_RemoveLight, AC_ToggleLightShadows, AC_DuplicateLight,
-    AC_SyncLightFromObject, AC_SyncAllLights, AC_SelectLightObject,
-    AC_MoveLightUp, AC_MoveLightDown,
-    AC_AddBlenderSpotLight, AC_SyncFromBlenderLight, AC_AddLightFromBlenderLights,
-    AC_ScanLights, AC_SyncAllFromBlender, AC_ExportAndUpdateLights,
-    AC_AddEmissiveMaterial, AC_AddEmissiveFromMesh, AC_RemoveEmissiveMaterial,
-    AC_ToggleEmissiveShadows, AC_ClearEmissiveMaterials, AC_SelectEmissiveObject,
-    AC_GenerateMap, AC_GeneratePreview, AC_CreatePreviewCamera,
-    AC_GrassFXMaterial, AC_GrassFXOccludingMaterial, AC_GrassFX,
-    AC_RainFX,
-    AC_Track, AC_Surface, AC_AudioSource,
-    AC_MeshList, AC_MaterialList, AC_PositionList, AC_DirectionList,
-    AC_CSPLightSettings, AC_SunSettings, AC_GlobalLighting, AC_EmissiveMaterial, AC_Light, AC_Lighting,
-    AC_ShaderProperty, AC_MaterialSettings, AC_TextureSettings,
+# Submodules exposing a ``classes`` tuple, in registration order.
+# PropertyGroups must come before the groups that point at them and parent
+# panels before their subpanels.
+_SUBMODULES = (
+    ".configs.grassfx",
+    ".configs.rainfx",
+    ".configs.track",
+    ".configs.surface",
+    ".configs.audio_source",
+    ".configs.lighting",
+    ".configs.kn5.material",
+    ".configs.kn5.texture",
     # Bulk edit PropertyGroups (must be before AC_Settings)
-    AC_BulkMaterialItem, AC_BulkPropertyValue, AC_BulkEditSettings,
-    KN5_MeshSettings, ExportSettings, AC_Settings,
-    # Bulk edit operators and UI
-    AC_UL_BulkMaterials, AC_BulkEditSelectMaterials, AC_BulkEditToggleAll, AC_BulkEditToggleNone, AC_BulkEditProperties,
-    AC_UL_Tags, AC_UL_Extensions, AC_UL_SurfaceExtensions, AC_UL_ShaderProperties, AC_UL_GrassFXMaterials, AC_UL_Materials, AC_UL_Lights, AC_UL_EmissiveMaterials,
-    # Main panels (parent panels must be registered first)
-    VIEW3D_PT_AC_Setup,
-    VIEW3D_PT_AC_SurfaceTools,
-    VIEW3D_PT_AC_Surfaces,  # subpanel of SurfaceTools
-    VIEW3D_PT_AC_Objects,
-    VIEW3D_PT_AC_Sidebar_Extra,
-    VIEW3D_PT_AC_Export,
-    VIEW3D_PT_AC_TrackImages,  # subpanel of Export
-    # Extra subpanels
-    VIEW3D_PT_AC_Sidebar_GrassFX,
-    VIEW3D_PT_AC_Sidebar_RainFX,
-    VIEW3D_PT_AC_Sidebar_TreeFX,
-    VIEW3D_PT_AC_Sidebar_AILines,
-    VIEW3D_PT_AC_Sidebar_CSPLights,
-    VIEW3D_PT_AC_Sidebar_EmissiveMaterials,
-    VIEW3D_PT_AC_MaterialEditor,
-    VIEW3D_PT_AC_MaterialProperties,  # subpanel of MaterialEditor
-    VIEW3D_PT_AC_ShaderProperties,    # subpanel of MaterialEditor
-    PROPERTIES_PT_AC_Material, NODE_PT_AC_Texture,
-    WM_MT_AssignSurface, WM_MT_ObjectSetup,
+    ".configs.bulk_edit",
+    ".settings",
+    ".gizmos.pitbox",
+    ".menus.ops.surface",
+    ".menus.ops.track",
+    ".menus.ops.project",
+    ".menus.ops.audio",
+    ".menus.ops.extensions",
+    ".menus.ops.object_setup",
+    ".menus.ops.material_setup",
+    ".menus.ops.grassfx",
+    ".menus.ops.rainfx",
+    ".menus.ops.treefx",
+    ".ai.ai_ops",
+    ".menus.ops.sync",
+    ".menus.ops.lighting",
+    ".menus.ops.image_generation",
+    ".menus.ops.bulk_edit",
+    ".menus.panels.material",
+    ".menus.panels.texture",
+    ".menus.sidebar",
+    ".menus.context",
+)
+
+# KN5 export submodules, registered by register_kn5() once Blender's UI is up
+# so enabling the add-on does not pay for the exporter (immediately when
+# running in background mode)
+_KN5_SUBMODULES = (
     # KN5 Export (v0.2.0 style) - Legacy UI classes for backward compatibility
-    AC_ContinueSmartExport,
-    ReportOperator,
-    CopyClipboardButtonOperator,
-    ExportKN5,
-    NodeProperties,
-    KN5_PT_NodePanel,
-    MaterialProperties,
-    TextureProperties,
+    ".kn5.exporter_ops",
+    ".kn5.ui_properties",
+    ".kn5.export_utils",
 )
+_kn5_registered = False
 
 # Handler to automatically initialize surfaces when a file is loaded
 @bpy.app.handlers.persistent
@@ -198,11 +263,17 @@ def sync_light_selection(scene, depsgraph):
     """Sync light list selection when viewport selection changes"""
     global _last_active_object
 
-    context = bpy.context
-    if not hasattr(context, 'active_object'):
+    # Fast path: nothing to sync in projects without CSP lights
+    ac_settings = getattr(scene, 'AC_Settings', None)
+    if ac_settings is None:
+        return
+    lighting = ac_settings.lighting
+    if not len(lighting.lights):
         return
 
-    active_obj = context.active_object
+    # Single context lookup; None when the context has no active object
+    # (e.g. during file load or from a background depsgraph update)
+    active_obj = getattr(bpy.context, 'active_object', None)
 
     # Only process if active object changed
     if active_obj == _last_active_object:
@@ -211,20 +282,67 @@ def sync_light_selection(scene, depsgraph):
 
     # Check if active object is a light linked to our list
     if active_obj and active_obj.type == 'LIGHT':
-        if hasattr(scene, 'AC_Settings'):
-            lighting = scene.AC_Settings.lighting
-            for i, light in enumerate(lighting.lights):
-                if light.linked_object == active_obj:
-                    if lighting.active_light_index != i:
-                        lighting.active_light_index = i
-                    break
+        i = lighting.find_linked_light_index(active_obj)
+        if i >= 0 and lighting.active_light_index != i:
+            lighting.active_light_index = i
+
+@bpy.app.handlers.persistent
+def invalidate_scene_caches(scene, depsgraph=None):
+    """Drop visible-material, emissive mesh and ext_config section caches when Blender data changes"""
+    from ..utils.helpers import clear_visible_materials_cache
+    from .configs.ext_config import invalidate_sections_cache
+    from .configs.lighting import clear_material_meshes_cache
+    if depsgraph is None or len(depsgraph.updates):
+        clear_visible_materials_cache()
+        clear_material_meshes_cache()
+    invalidate_sections_cache(depsgraph)
+
+def register_kn5():
+    """Register the KN5 exporter classes (no-op if already registered)"""
+    global _kn5_registered
+    if _kn5_registered:
+        return
+    from bpy.utils import register_class
+    for name in _KN5_SUBMODULES:
+        module = importlib.import_module(name, __name__)
+        for cls in module.classes:
+            register_class(cls)
+    _kn5_registered = True
+
+def unregister_kn5():
+    global _kn5_registered
+    if not _kn5_registered:
+        return
+    from bpy.utils import unregister_class
+    for name in reversed(_KN5_SUBMODULES):
+        module = sys.modules[importlib.util.resolve_name(name, __name__)]
+        for cls in reversed(module.classes):
+            unregister_class(cls)
+    _kn5_registered = False
+
+def _register_kn5_deferred():
+    register_kn5()
+    return None  # one-shot timer
+
+def kn5_export_menu(self, context):
+    """File > Export entry; drawn once the KN5 exporter is registered"""
+    if not _kn5_registered:
+        return
+    from .kn5.exporter_ops import menu_func
+    menu_func(self, context)
 
 def register():
     from bpy.utils import register_class
-    for cls in __classes__:
-        register_class(cls)
-    # Register export utilities
-    export_utils.register()
+    from .ai import ai_ops as ai_ops_module
+    from .configs.kn5 import AC_MaterialSettings, AC_TextureSettings
+    from .configs.lighting import AC_CSPLightSettings
+    from .menus.context import surface_menu
+    from .settings import AC_Settings, KN5_MeshSettings
+
+    for name in _SUBMODULES:
+        module = importlib.import_module(name, __name__)
+        for cls in module.classes:
+            register_class(cls)
     bpy.types.Scene.AC_Settings = bpy.props.PointerProperty(type=AC_Settings)
     bpy.types.Object.AC_KN5 = bpy.props.PointerProperty(type=KN5_MeshSettings)
     bpy.types.Object.AC_CSP = bpy.props.PointerProperty(type=AC_CSPLightSettings)
@@ -232,17 +350,30 @@ def register():
     bpy.types.ShaderNodeTexImage.AC_Texture = bpy.props.PointerProperty(type=AC_TextureSettings)
     # Context menus
     bpy.types.VIEW3D_MT_object_context_menu.append(surface_menu)
-    # File > Export menu
-    bpy.types.TOPBAR_MT_file_export.append(menu_func)
+    # File > Export menu, KN5 classes are registered right after startup.
+    # Timers never run in background mode, so scripted exports need them now.
+    bpy.types.TOPBAR_MT_file_export.append(kn5_export_menu)
+    if bpy.app.background:
+        register_kn5()
+    else:
+        bpy.app.timers.register(_register_kn5_deferred, first_interval=0.0, persistent=True)
     # Register load handler for automatic surface initialization
     bpy.app.handlers.load_post.append(initialize_surfaces_on_load)
     # Register depsgraph handler for light selection sync
     bpy.app.handlers.depsgraph_update_post.append(sync_light_selection)
+    # Register handlers that invalidate cached scene data
+    bpy.app.handlers.depsgraph_update_post.append(invalidate_scene_caches)
+    bpy.app.handlers.load_post.append(invalidate_scene_caches)
+    bpy.app.handlers.undo_post.append(invalidate_scene_caches)
+    bpy.app.handlers.redo_post.append(invalidate_scene_caches)
     # Register AI line import/export menus
     ai_ops_module.register()
 
 def unregister():
     from bpy.utils import unregister_class
+    from .ai import ai_ops as ai_ops_module
+    from .menus.context import surface_menu
+
     # Unregister AI line import/export menus
     ai_ops_module.unregister()
     # Remove handlers
@@ -250,18 +381,27 @@ def unregister():
         bpy.app.handlers.depsgraph_update_post.remove(sync_light_selection)
     if initialize_surfaces_on_load in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(initialize_surfaces_on_load)
+    for handlers in (bpy.app.handlers.depsgraph_update_post, bpy.app.handlers.load_post,
+                     bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if invalidate_scene_caches in handlers:
+            handlers.remove(invalidate_scene_caches)
     # Remove context menus
     bpy.types.VIEW3D_MT_object_context_menu.remove(surface_menu)
-    # Remove File > Export menu
-    bpy.types.TOPBAR_MT_file_export.remove(menu_func)
+    # Remove File > Export menu and KN5 exporter
+    bpy.types.TOPBAR_MT_file_export.remove(kn5_export_menu)
+    if bpy.app.timers.is_registered(_register_kn5_deferred):
+        bpy.app.timers.unregister(_register_kn5_deferred)
+    unregister_kn5()
     # Remove properties
     del bpy.types.ShaderNodeTexImage.AC_Texture
     del bpy.types.Material.AC_Material
     del bpy.types.Object.AC_CSP
     del bpy.types.Object.AC_KN5
     del bpy.types.Scene.AC_Settings
-    # Unregister export utilities
-    export_utils.unregister()
-    # Unregister classes
-    for cls in reversed(__classes__):
-        unregister_class(cls)
+    # Unregister classes, skipping submodules that were never loaded
+    for name in reversed(_SUBMODULES):
+        module = sys.modules.get(importlib.util.resolve_name(name, __name__))
+        if module is None:
+            continue
+        for cls in reversed(module.classes):
+            unregister_class(cls)
@@ -18,6 +18,8 @@ from .ai_format import (
     AI_HEADER_SIZE,
     AI_IDEAL_POINT_SIZE,
     AI_DETAIL_POINT_SIZE,
+    IDEAL_DTYPE,
+    DETAIL_DTYPE,
     AIPoint,
     AIDetailPoint,
     write_ai_file,
@@ -31,6 +33,8 @@ __all__ = [
     'AI_HEADER_SIZE',
     'AI_IDEAL_POINT_SIZE',
     'AI_DETAIL_POINT_SIZE',
+    'IDEAL_DTYPE',
+    'DETAIL_DTYPE',
     'AIPoint',
     'AIDetailPoint',
     'write_ai_file',
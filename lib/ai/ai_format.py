@@ -13,9 +13,12 @@ Coordinate system:
 - Conversion: AC(x,y,z) -> Blender(x,-z,y)
 """
 
+import os
 import struct
-from dataclasses import dataclass, field
-from typing import List, Tuple
+from dataclasses import astuple, dataclass, field, fields
+from typing import Tuple
+
+import numpy as np
 
 from ...utils.coordinates import ac_to_blender, blender_to_ac
 
@@ -25,6 +28,9 @@ AI_HEADER_SIZE = 16  # 4 int32s
 AI_IDEAL_POINT_SIZE = 20  # 4 floats + 1 int
 AI_DETAIL_POINT_SIZE = 72  # 18 floats
 
+# Precompiled (un)packer for the file header
+_HEADER = struct.Struct("<4i")
+
 
 @dataclass
 class AIPoint:
@@ -59,15 +65,38 @@ class AIDetailPoint:
     tag: float = 0.0  # Index 17 - Surface tag
 
 
+# Structured dtypes matching the on-disk record layouts, field for field
+IDEAL_DTYPE = np.dtype([
+    ("x", "<f4"),
+    ("y", "<f4"),
+    ("z", "<f4"),
+    ("distance", "<f4"),
+    ("id", "<i4"),
+])
+DETAIL_DTYPE = np.dtype([(f.name, "<f4") for f in fields(AIDetailPoint)])
+
+
+def _as_records(points, dtype: np.dtype) -> np.ndarray:
+    """Coerce an array or a list of AIPoint/AIDetailPoint into a record array."""
+    if isinstance(points, np.ndarray):
+        return np.asarray(points, dtype=dtype)
+    return np.array([astuple(p) for p in points], dtype=dtype)
+
+
 @dataclass
 class AILineData:
-    """Complete AI line data from a .ai file."""
+    """
+    Complete AI line data from a .ai file.
+
+    Points are stored as structured arrays (IDEAL_DTYPE / DETAIL_DTYPE) laid
+    out exactly like the file, so reading and writing are single copies.
+    """
     header_version: int = 0
     point_count: int = 0
     unknown1: int = 0
     unknown2: int = 0
-    ideal_points: List[AIPoint] = field(default_factory=list)
-    detail_points: List[AIDetailPoint] = field(default_factory=list)
+    ideal_points: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=IDEAL_DTYPE))
+    detail_points: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=DETAIL_DTYPE))
 
 
 def read_ai_file(filepath: str) -> AILineData:
@@ -94,49 +123,21 @@ def read_ai_file(filepath: str) -> AILineData:
         if len(header_bytes) < AI_HEADER_SIZE:
             raise ValueError("Invalid AI file: header too short")
 
-        data.header_version, data.point_count, data.unknown1, data.unknown2 = struct.unpack(
-            "<4i", header_bytes
+        data.header_version, data.point_count, data.unknown1, data.unknown2 = _HEADER.unpack(
+            header_bytes
         )
 
         # Read ideal line points
-        for i in range(data.point_count):
-            point_bytes = f.read(AI_IDEAL_POINT_SIZE)
-            if len(point_bytes) < AI_IDEAL_POINT_SIZE:
-                print(f"Warning: Ideal line data truncated at point {i}/{data.point_count}")
-                break
-
-            x, y, z, dist, point_id = struct.unpack("<4fi", point_bytes)
-
-            data.ideal_points.append(AIPoint(x=x, y=y, z=z, distance=dist, id=point_id))
+        data.ideal_points = np.fromfile(f, dtype=IDEAL_DTYPE, count=data.point_count)
+        if len(data.ideal_points) < data.point_count:
+            print(f"Warning: Ideal line data truncated at point {len(data.ideal_points)}/{data.point_count}")
+            data.detail_points = np.empty(0, dtype=DETAIL_DTYPE)
+            return data
 
         # Read detail data (starts after all ideal points)
-        for i in range(data.point_count):
-            detail_bytes = f.read(AI_DETAIL_POINT_SIZE)
-            if len(detail_bytes) < AI_DETAIL_POINT_SIZE:
-                print(f"Warning: Detail data truncated at point {i}/{data.point_count}")
-                break
-
-            values = struct.unpack("<18f", detail_bytes)
-            data.detail_points.append(AIDetailPoint(
-                unknown=values[0],
-                speed=values[1],
-                gas=values[2],
-                brake=values[3],
-                obsolete_lat_g=values[4],
-                radius=values[5],
-                wall_left=values[6],
-                wall_right=values[7],
-                camber=values[8],
-                direction=values[9],
-                normal_x=values[10],
-                normal_y=values[11],
-                normal_z=values[12],
-                length=values[13],
-                forward_x=values[14],
-                forward_y=values[15],
-                forward_z=values[16],
-                tag=values[17],
-            ))
+        data.detail_points = np.fromfile(f, dtype=DETAIL_DTYPE, count=data.point_count)
+        if len(data.detail_points) < data.point_count:
+            print(f"Warning: Detail data truncated at point {len(data.detail_points)}/{data.point_count}")
 
     return data
 
@@ -149,50 +150,43 @@ def write_ai_file(filepath: str, data: AILineData) -> None:
         filepath: Output path for .ai file
         data: AILineData to write
     """
-    # Magic number: encodes point count in first detail record
-    # This is how AC expects the count to be embedded in the data
-    POINT_COUNT_MAGIC = 1.40129846432481e-45
-
-    point_count = len(data.ideal_points)
-
-    with open(filepath, "wb") as f:
-        # Write header (little-endian)
-        f.write(struct.pack("<4i",
-            data.header_version,
-            point_count,
-            data.unknown1,
-            data.unknown2
-        ))
-
-        # Write ideal line points
-        for point in data.ideal_points:
-            f.write(struct.pack("<4fi", point.x, point.y, point.z, point.distance, point.id))
-
-        # Write detail data
-        for i, detail in enumerate(data.detail_points):
-            # First point has magic value encoding point count
-            unknown_value = POINT_COUNT_MAGIC * point_count if i == 0 else detail.unknown
-
-            f.write(struct.pack("<18f",
-                unknown_value,
-                detail.speed,
-                detail.gas,
-                detail.brake,
-                detail.obsolete_lat_g,
-                detail.radius,
-                detail.wall_left,
-                detail.wall_right,
-                detail.camber,
-                detail.direction,
-                detail.normal_x,
-                detail.normal_y,
-                detail.normal_z,
-                detail.length,
-                detail.forward_x,
-                detail.forward_y,
-                detail.forward_z,
-                detail.tag,
-            ))
+    ideal = _as_records(data.ideal_points, IDEAL_DTYPE)
+    detail = _as_records(data.detail_points, DETAIL_DTYPE)
+    point_count = len(ideal)
+
+    # Assemble the whole file in one preallocated buffer
+    ideal_offset = _HEADER.size
+    detail_offset = ideal_offset + ideal.nbytes
+    buf = bytearray(detail_offset + detail.nbytes)
+    # Write header (little-endian)
+    _HEADER.pack_into(
+        buf, 0,
+        data.header_version,
+        point_count,
+        data.unknown1,
+        data.unknown2
+    )
+    np.frombuffer(buf, IDEAL_DTYPE, point_count, ideal_offset)[:] = ideal
+    # Copied into the buffer, so the magic value below never leaks into the caller's data
+    out_detail = np.frombuffer(buf, DETAIL_DTYPE, len(detail), detail_offset)
+    out_detail[:] = detail
+
+    # First point's "unknown" float carries the point count as its raw bits
+    # (AC reads it back as an int32); bitcast instead of multiplying by the
+    # smallest subnormal so no float arithmetic is involved
+    if len(out_detail):
+        out_detail["unknown"][:1] = np.array([point_count], dtype="<i4").view("<f4")
+
+    # Hand the buffer straight to the OS instead of going through a
+    # BufferedWriter; O_BINARY keeps Windows from translating newlines
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(filepath, flags, 0o644)
+    try:
+        view = memoryview(buf)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 # Re-export coordinate conversion functions for backward compatibility
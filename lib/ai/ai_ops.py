@@ -4,27 +4,8 @@ Blender operators for AI line export.
 Export writes selection to fast_lane.ai in the track's ai folder.
 """
 
-import os
-import math
-from typing import List, Tuple
-
-import bpy
 from bpy.types import Operator
-from bpy.props import (
-    StringProperty,
-    BoolProperty,
-    FloatProperty,
-)
-from mathutils import Vector
-
-from .ai_format import (
-    AIPoint,
-    AIDetailPoint,
-    AILineData,
-    write_ai_file,
-    blender_to_ac_coords,
-)
-from ...utils.files import get_ai_directory, set_path_reference
+from bpy.props import FloatProperty
 
 
 class AC_ExportAILine(Operator):
@@ -65,6 +46,14 @@ class AC_ExportAILine(Operator):
         return bool(context.scene.AC_Settings.working_dir)
 
     def execute(self, context):
+        # Imported here so enabling the add-on does not load NumPy or the file helpers
+        import os
+
+        import numpy as np
+
+        from .ai_format import DETAIL_DTYPE, IDEAL_DTYPE, AILineData, write_ai_file
+        from ...utils.files import get_ai_directory, set_path_reference
+
         # Get working directory and set it for file utilities
         settings = context.scene.AC_Settings
         if not settings.working_dir:
@@ -89,47 +78,48 @@ class AC_ExportAILine(Operator):
         # Get mesh data
         mesh = ideal_obj.data
 
-        if len(mesh.vertices) < 2:
+        vertex_count = len(mesh.vertices)
+        if vertex_count < 2:
             self.report({"ERROR"}, "Mesh must have at least 2 vertices")
             return {"CANCELLED"}
 
         # Build vertex chain following edges
-        # Create edge map
-        edge_map = {}
-        for edge in mesh.edges:
-            v1, v2 = edge.vertices[0], edge.vertices[1]
-            if v1 not in edge_map:
-                edge_map[v1] = []
-            if v2 not in edge_map:
-                edge_map[v2] = []
-            edge_map[v1].append(v2)
-            edge_map[v2].append(v1)
+        # Read the edge list in one call and build a CSR neighbour table:
+        # neighbours[ptr[v]:ptr[v + 1]] are the vertices linked to v, in edge order
+        edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", edge_verts)
+        degree = np.bincount(edge_verts, minlength=vertex_count)
+        # Each edge stores its two ends side by side, so slot i pairs with i ^ 1
+        neighbours = edge_verts[np.argsort(edge_verts, kind="stable") ^ 1].tolist()
+        ptr = np.concatenate(([0], np.cumsum(degree))).tolist()
 
         # Find start vertex (one with only one edge connection, or vertex 0 for loops)
-        start_vertex = 0
-        for v_idx, connections in edge_map.items():
-            if len(connections) == 1:
-                start_vertex = v_idx
-                break
-
-        # Walk the edge chain
-        ordered_vertices = [start_vertex]
-        visited = {start_vertex}
+        # Use the first such vertex in edge order
+        end_slots = edge_verts[degree[edge_verts] == 1]
+        start_vertex = int(end_slots[0]) if len(end_slots) else 0
+
+        # Walk the edge chain, writing the visit order straight into a
+        # preallocated index array (a chain visits each vertex at most once)
+        order = np.empty(vertex_count, dtype=np.intp)
+        order[0] = start_vertex
+        point_count = 1
+        visited = bytearray(vertex_count)
+        visited[start_vertex] = 1
 
         current = start_vertex
         while True:
-            neighbors = edge_map.get(current, [])
             next_vertex = None
-            for n in neighbors:
-                if n not in visited:
+            for n in neighbours[ptr[current]:ptr[current + 1]]:
+                if not visited[n]:
                     next_vertex = n
                     break
 
             if next_vertex is None:
                 break
 
-            ordered_vertices.append(next_vertex)
-            visited.add(next_vertex)
+            order[point_count] = next_vertex
+            point_count += 1
+            visited[next_vertex] = 1
             current = next_vertex
 
         # Convert vertices to AI data
@@ -137,64 +127,34 @@ class AC_ExportAILine(Operator):
         ai_data.header_version = 7  # Standard AC version
         ai_data.unknown1 = 0
         ai_data.unknown2 = 0
-
-        total_distance = 0.0
-        prev_pos = None
-
-        for i, v_idx in enumerate(ordered_vertices):
-            vertex = mesh.vertices[v_idx]
-
-            # Transform to world space
-            world_pos = ideal_obj.matrix_world @ vertex.co
-
-            # Convert to AC coordinates
-            ax, ay, az = blender_to_ac_coords(
-                world_pos.x / self.scale,
-                world_pos.y / self.scale,
-                world_pos.z / self.scale,
-            )
-
-            # Calculate distance
-            if prev_pos is not None:
-                dx = ax - prev_pos[0]
-                dy = ay - prev_pos[1]
-                dz = az - prev_pos[2]
-                total_distance += math.sqrt(dx * dx + dy * dy + dz * dz)
-
-            ai_data.ideal_points.append(AIPoint(
-                x=ax,
-                y=ay,
-                z=az,
-                distance=total_distance,
-                id=i,
-            ))
-
-            # AC expects a "basic" AI line with mostly zeros
-            # The actual AI parameters (speed, gas, brake, etc.) are computed
-            # by AC/ksEditor when the track is processed
-            # Only wall distances should be set
-            ai_data.detail_points.append(AIDetailPoint(
-                unknown=0.0,  # First point will get magic value in write_ai_file
-                speed=0.0,
-                gas=0.0,
-                brake=0.0,
-                obsolete_lat_g=0.0,
-                radius=0.0,
-                wall_left=self.default_wall_distance,
-                wall_right=self.default_wall_distance,
-                camber=0.0,
-                direction=0.0,
-                normal_x=0.0,
-                normal_y=0.0,
-                normal_z=0.0,
-                length=0.0,
-                forward_x=0.0,
-                forward_y=0.0,
-                forward_z=0.0,
-                tag=0.0,
-            ))
-
-            prev_pos = (ax, ay, az)
+        ai_data.ideal_points = ideal = np.empty(point_count, dtype=IDEAL_DTYPE)
+
+        # AC expects a "basic" AI line with mostly zeros
+        # The actual AI parameters (speed, gas, brake, etc.) are computed
+        # by AC/ksEditor when the track is processed
+        # Only wall distances should be set
+        # (first point's "unknown" gets the magic value in write_ai_file)
+        ai_data.detail_points = detail = np.zeros(point_count, dtype=DETAIL_DTYPE)
+        detail["wall_left"] = self.default_wall_distance
+        detail["wall_right"] = self.default_wall_distance
+
+        # Read every vertex position in one call and transform the chain in bulk
+        # (one RNA call instead of a vertices[i].co lookup per chain point)
+        coords = np.empty(vertex_count * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords)
+        local = coords.reshape(-1, 3)[order[:point_count]].astype(np.float64)
+        matrix = np.array(ideal_obj.matrix_world, dtype=np.float64)
+        world = (local @ matrix[:3, :3].T + matrix[:3, 3]) / self.scale
+
+        # Convert to AC coordinates: (x, y, z) -> (x, z, -y)
+        ideal["x"] = world[:, 0]
+        ideal["y"] = world[:, 2]
+        ideal["z"] = -world[:, 1]
+
+        # Cumulative distance along the line (the axis swap preserves lengths)
+        ideal["distance"][0] = 0.0
+        ideal["distance"][1:] = np.cumsum(np.linalg.norm(np.diff(world, axis=0), axis=1))
+        ideal["id"] = np.arange(point_count)
 
         # Get the ai directory (creates it if needed)
         ai_dir = get_ai_directory()
@@ -214,6 +174,11 @@ class AC_ExportAILine(Operator):
             return {"CANCELLED"}
 
 
+classes = (
+    AC_ExportAILine,
+)
+
+
 def register():
     # No menu entries needed - export is done from the sidebar panel
     pass
@@ -375,3 +375,8 @@ REVERB_PRESETS = {
     'UNDERWATER': (1500, 7, 11, 5000, 10, 100, 100, 250, 0, 500, 92, 7.0),
     'CUSTOM': ()
 }
+
+
+classes = (
+    AC_AudioSource,
+)
@@ -5,6 +5,8 @@ These are separated from the operators to avoid circular import issues,
 since AC_Settings needs to reference AC_BulkEditSettings.
 """
 
+from functools import lru_cache
+
 from bpy.types import PropertyGroup
 from bpy.props import (
     BoolProperty,
@@ -16,6 +18,12 @@ from bpy.props import (
 )
 
 
+@lru_cache(maxsize=16)
+def _split_material_names(names: str) -> tuple:
+    """Split a pipe-separated name list (cached per string, so UI redraws don't re-split)"""
+    return tuple(names.split("|"))
+
+
 class AC_BulkMaterialItem(PropertyGroup):
     """Single material entry in bulk edit selection list"""
     name: StringProperty(name="Material Name")
@@ -41,3 +49,12 @@ class AC_BulkEditSettings(PropertyGroup):
     )
     common_properties: CollectionProperty(type=AC_BulkPropertyValue)
     common_properties_index: IntProperty(default=0)
+
+    def get_selected_material_names(self) -> tuple:
+        """Selected material names in selection order"""
+        return _split_material_names(self.selected_material_names)
+
+
+classes = (
+    AC_BulkMaterialItem, AC_BulkPropertyValue, AC_BulkEditSettings,
+)
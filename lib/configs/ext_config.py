@@ -15,12 +15,17 @@ Section Order:
 8. Global Extensions (preserved custom user sections)
 """
 
+import copy
+import io
+import mmap
 import os
 import re
+import sys
+import time
 from datetime import datetime
-from typing import Optional
-
-from ...utils.helpers import is_hidden_name
+from functools import lru_cache
+from operator import itemgetter
+from typing import NamedTuple, Optional
 
 
 # =============================================================================
@@ -44,6 +49,12 @@ SECTION_ORDER = [
     "SHADER_REPLACEMENT_",  # Prefix (includes ksTree flag)
 ]
 
+# Numbered sections written in auto-index form ([SHADER_REPLACEMENT_...])
+AUTO_INDEXED_SECTIONS = frozenset({
+    "SHADER_REPLACEMENT",
+    "MATERIAL_ADJUSTMENT",
+})
+
 # Sections that are managed by specific operators and should be preserved
 TREES_SECTION = "TREES"  # Managed only by TreeFX operator
 
@@ -86,11 +97,32 @@ SECTION_CATEGORIES = {
 # Footer header for user custom sections (always present)
 USER_SECTIONS_HEADER = f"\n{SEPARATOR_LINE}\n; USER CUSTOM SECTIONS\n{SEPARATOR_LINE}\n"
 
+# Lookup tables derived from the lists above, so classifying a section name is
+# a dict lookup plus one C-level str.startswith(tuple) instead of a Python loop
+_SECTION_ORDER_INDEX = {name: i for i, name in enumerate(SECTION_ORDER)}
+_ORDER_PREFIXES = tuple((i, p) for i, p in enumerate(SECTION_ORDER) if p.endswith('_'))
+_ORDER_PREFIX_TUPLE = tuple(p for _, p in _ORDER_PREFIXES)
+_CATEGORY_PREFIX_ENTRIES = tuple((p, h) for p, h in SECTION_CATEGORIES.items() if p.endswith('_'))
+_CATEGORY_PREFIXES = tuple(p for p, _ in _CATEGORY_PREFIX_ENTRIES)
+_ALL_MANAGED_PREFIXES = tuple(ALL_MANAGED_SECTIONS)
+
 
 # =============================================================================
 # PARSING
 # =============================================================================
 
+# One line of ext_config.ini: either a "[SECTION]" header (group 1, brackets
+# included) or a KEY=VALUE pair (groups 2 and 3, still to be stripped).
+# Lines starting with ';' or '#' and blank lines do not match.
+_INI_LINE_RE = re.compile(
+    r'^[^\S\n]*(?:'
+    r'(\[.*\])[^\S\n]*$'
+    r'|([^;#=\s][^=\n]*)?=(.*)'
+    r')',
+    re.MULTILINE,
+)
+
+
 def parse_ext_config(filepath: str) -> dict:
     """
     Parse ext_config.ini into a dictionary of sections.
@@ -105,74 +137,131 @@ def parse_ext_config(filepath: str) -> dict:
     Returns:
         Dict of {section_name: {key: value, ...}, ...}
     """
-    if not os.path.exists(filepath):
+    return _sections_of(_load_ini(filepath))
+
+
+def _sections_of(ini: Optional['_IniFile']) -> dict:
+    """Copy of the parsed sections of a loaded file ({} if it doesn't exist)."""
+    if ini is None:
         return {}
+    # Copy so callers never modify the cached parse
+    return {name: dict(values) for name, values in ini.sections.items()}
+
 
+def _resolve_autoindex(section_name: str, counters: dict) -> str:
+    """
+    Number an auto-indexed section name (e.g., SHADER_REPLACEMENT_...).
+
+    Each '_...' name of a prefix gets the next index from counters, so the
+    sections read back as SHADER_REPLACEMENT_0, SHADER_REPLACEMENT_1, ...
+    Other names are returned unchanged.
+    """
+    if section_name.endswith('_...'):
+        prefix = section_name[:-3]  # Remove '...'
+        index = counters.get(prefix, 0)
+        counters[prefix] = index + 1
+        return f"{prefix}{index}"
+    return section_name
+
+
+def _parse_sections(content: str) -> dict:
+    """Parse the text of ext_config.ini into {section_name: {key: value}}."""
     sections = {}
     current_section = None
     # Track counters for auto-indexed section types
     auto_index_counters = {}
 
+    # Comments and blank lines never match, so every hit is a header or a pair
+    for header, key, value in _INI_LINE_RE.findall(content):
+        # Section header
+        if header:
+            # Interned like the keys: names are looked up and compared a lot
+            current_section = sys.intern(_resolve_autoindex(header[1:-1], auto_index_counters))
+            if current_section not in sections:
+                sections[current_section] = {}
+            continue
+
+        # Key-value pair (keys repeat across sections, so intern them)
+        if current_section:
+            sections[current_section][sys.intern(key.rstrip())] = value.strip()
+
+    return sections
+
+
+class _IniFile(NamedTuple):
+    """Everything read from one version of ext_config.ini."""
+    lines: list
+    timestamp: Optional[datetime]
+    header_lines: list
+    section_blocks: list
+    footer_lines: list
+    sections: dict
+
+
+@lru_cache(maxsize=8)
+def _load_ini_cached(filepath: str, mtime_ns: int, size: int) -> _IniFile:
+    """
+    Read and parse ext_config.ini in a single pass.
+
+    mtime_ns and size are not used directly; they are part of the cache key so
+    that a changed file is parsed again.
+    """
     with open(filepath, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
+        lines = f.readlines()
 
-            # Skip empty lines and comments
-            if not line or line.startswith(';') or line.startswith('#'):
-                continue
+    header_lines, section_blocks, footer_lines = _split_file_structure(lines)
+    return _IniFile(
+        lines=lines,
+        timestamp=_find_timestamp(lines),
+        header_lines=header_lines,
+        section_blocks=section_blocks,
+        footer_lines=footer_lines,
+        sections=_parse_sections(''.join(lines)),
+    )
 
-            # Section header
-            if line.startswith('[') and line.endswith(']'):
-                section_name = line[1:-1]
-
-                # Handle auto-indexed sections (e.g., SHADER_REPLACEMENT_...)
-                if section_name.endswith('_...'):
-                    prefix = section_name[:-3]  # Remove '...'
-                    if prefix not in auto_index_counters:
-                        auto_index_counters[prefix] = 0
-                    section_name = f"{prefix}{auto_index_counters[prefix]}"
-                    auto_index_counters[prefix] += 1
-
-                current_section = section_name
-                if current_section not in sections:
-                    sections[current_section] = {}
-                continue
 
-            # Key-value pair
-            if current_section and '=' in line:
-                key, _, value = line.partition('=')
-                key = key.strip()
-                value = value.strip()
-                sections[current_section][key] = value
+def _load_ini(filepath: str) -> Optional[_IniFile]:
+    """
+    Return the cached parse of ext_config.ini, or None if it doesn't exist.
 
-    return sections
+    This is the single stat per call; entry points load once and pass the
+    result on instead of checking os.path.exists separately.
+    """
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return _load_ini_cached(filepath, st.st_mtime_ns, st.st_size)
 
 
 # =============================================================================
 # SECTION ORDERING
 # =============================================================================
 
+@lru_cache(maxsize=2048)
 def get_section_sort_key(section_name: str) -> tuple:
     """
     Get sort key for a section to maintain consistent ordering.
 
     Returns tuple of (order_index, numeric_suffix) for stable sorting.
+    Results are cached, since the key depends only on the section name.
     """
     # Check exact matches first
-    for i, pattern in enumerate(SECTION_ORDER):
-        if section_name == pattern:
-            return (i, 0)
+    index = _SECTION_ORDER_INDEX.get(section_name)
+    if index is not None:
+        return (index, 0)
 
     # Check prefix matches for numbered sections
-    for i, pattern in enumerate(SECTION_ORDER):
-        if pattern.endswith('_') and section_name.startswith(pattern):
-            # Extract numeric suffix for sub-ordering
-            suffix = section_name[len(pattern):]
-            try:
-                num = int(suffix)
-            except ValueError:
-                num = 9999
-            return (i, num)
+    if section_name.startswith(_ORDER_PREFIX_TUPLE):
+        for i, pattern in _ORDER_PREFIXES:
+            if section_name.startswith(pattern):
+                # Extract numeric suffix for sub-ordering
+                suffix = section_name[len(pattern):]
+                try:
+                    num = int(suffix)
+                except ValueError:
+                    num = 9999
+                return (i, num)
 
     # Unknown sections go at the end (global extensions)
     return (999, 0)
@@ -188,13 +277,24 @@ def sort_sections(sections: dict) -> list:
     Returns:
         List of section names in correct order
     """
-    return sorted(sections.keys(), key=get_section_sort_key)
+    names = list(sections)
+    keys = [get_section_sort_key(name) for name in names]
+    # Sections are usually built in output order already; skip the sort then
+    if all(a <= b for a, b in zip(keys, keys[1:])):
+        return names
+    return [name for _, name in sorted(zip(keys, names), key=lambda pair: pair[0])]
 
 
 # =============================================================================
 # VALUE FORMATTING
 # =============================================================================
 
+@lru_cache(maxsize=4096)
+def _format_float(value: float) -> str:
+    """Format a float for INI output (cached, the same values recur a lot)."""
+    return f"{value:.6f}".rstrip('0').rstrip('.')
+
+
 def format_value(value) -> str:
     """
     Format a value for INI output with consistent formatting.
@@ -208,12 +308,14 @@ def format_value(value) -> str:
     if isinstance(value, bool):
         return "1" if value else "0"
     elif isinstance(value, float):
-        # Use reasonable precision, strip trailing zeros
-        formatted = f"{value:.6f}".rstrip('0').rstrip('.')
-        return formatted
+        # Use reasonable precision, strip trailing zeros. Zeros bypass the
+        # cache since 0.0 and -0.0 are equal keys but format differently.
+        if not value:
+            return f"{value:.6f}".rstrip('0').rstrip('.')
+        return _format_float(value)
     elif isinstance(value, (tuple, list)):
         # Format each element and join with comma
-        return ", ".join(format_value(v) for v in value)
+        return ", ".join(map(format_value, value))
     else:
         return str(value)
 
@@ -222,50 +324,62 @@ def format_value(value) -> str:
 # WRITING
 # =============================================================================
 
-def _is_managed_section(section_name: str, managed_prefixes: list) -> bool:
-    """Check if a section name matches any of the managed prefixes."""
-    for prefix in managed_prefixes:
-        if section_name == prefix or section_name.startswith(prefix):
-            return True
-    return False
-
-
-def _is_generated_header_line(line: str) -> bool:
-    """Check if a line is one of our generated category headers."""
-    stripped = line.strip()
-    # Check for separator line
-    if stripped.startswith('; ===') and stripped.endswith('==='):
-        return True
-    # Check for category title lines (e.g., "; INCLUDES", "; GRASS FX", etc.)
-    category_titles = [
-        "; INCLUDES", "; GRASS FX", "; RAIN FX", "; TREES",
-        "; CSP LIGHTS", "; EMISSIVE MATERIALS", "; SHADER REPLACEMENTS",
-        "; USER CUSTOM SECTIONS"
-    ]
-    if stripped in category_titles:
-        return True
-    return False
+def _is_managed_section(section_name: str, managed_prefixes) -> bool:
+    """
+    Check if a section name matches any of the managed prefixes.
 
+    Pass a tuple where possible; a list is converted on every call.
+    """
+    # An exact name is also a prefix of itself
+    return section_name.startswith(tuple(managed_prefixes))
 
-def _filter_generated_headers(lines: list) -> list:
-    """Filter out our generated category headers from a list of lines."""
-    return [line for line in lines if not _is_generated_header_line(line)]
+
+# Whole-line patterns (matched against the stripped line) for the text we
+# generate ourselves: separator lines, category titles and the timestamp
+_GENERATED_HEADER_PATTERN = (
+    r'; ===(?:={0,2}|.*===)'
+    r'|; (?:INCLUDES|GRASS FX|RAIN FX|TREES|CSP LIGHTS|EMISSIVE MATERIALS'
+    r'|SHADER REPLACEMENTS|USER CUSTOM SECTIONS)'
+)
+_TIMESTAMP_PATTERN = re.escape(TIMESTAMP_PREFIX) + r'.*\S'
+
+
+def _compile_line_filter(pattern: str) -> re.Pattern:
+    """Compile a pattern that matches whole lines, newline included, for re.sub."""
+    return re.compile(rf'^[^\S\n]*(?:{pattern})[^\S\n]*(?:\n|\Z)', re.MULTILINE)
 
 
-def _is_timestamp_line(line: str) -> bool:
-    """Check if a line is our timestamp line."""
-    return line.strip().startswith(TIMESTAMP_PREFIX)
+_GENERATED_HEADER_RE = _compile_line_filter(_GENERATED_HEADER_PATTERN)
+_TIMESTAMP_RE = _compile_line_filter(_TIMESTAMP_PATTERN)
+_GENERATED_HEADER_OR_TIMESTAMP_RE = _compile_line_filter(
+    f'{_GENERATED_HEADER_PATTERN}|{_TIMESTAMP_PATTERN}'
+)
 
 
-def _filter_timestamp(lines: list) -> list:
-    """Filter out our timestamp line from a list of lines."""
-    return [line for line in lines if not _is_timestamp_line(line)]
+def _remove_lines(lines: list, line_filter: re.Pattern) -> list:
+    """Remove every line matched by line_filter with one regex pass over the joined text."""
+    return io.StringIO(line_filter.sub('', ''.join(lines))).readlines()
+
+
+def _filter_generated_headers(lines: list) -> list:
+    """Filter out our generated category headers from a list of lines."""
+    return _remove_lines(lines, _GENERATED_HEADER_RE)
+
+
+# [epoch second, formatted line] of the last generated timestamp
+_TS_CACHE = [None, ""]
 
 
 def _generate_timestamp_line() -> str:
     """Generate a timestamp line with current date/time."""
-    now = datetime.now().strftime(TIMESTAMP_FORMAT)
-    return f"{TIMESTAMP_PREFIX}{now}\n"
+    # TIMESTAMP_FORMAT has one-second resolution, so repeated writes within
+    # the same second reuse the formatted line
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        formatted = datetime.fromtimestamp(now).strftime(TIMESTAMP_FORMAT)
+        _TS_CACHE[0] = now
+        _TS_CACHE[1] = f"{TIMESTAMP_PREFIX}{formatted}\n"
+    return _TS_CACHE[1]
 
 
 def read_timestamp(filepath: str) -> Optional[datetime]:
@@ -278,29 +392,72 @@ def read_timestamp(filepath: str) -> Optional[datetime]:
     Returns:
         datetime object if timestamp found, None otherwise
     """
-    if not os.path.exists(filepath):
+    try:
+        with open(filepath, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _find_timestamp_in_buffer(mm)
+    except (OSError, ValueError):
+        # Missing file, or an empty one (mmap can't map zero bytes)
         return None
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        for line in f:
-            if line.strip().startswith(TIMESTAMP_PREFIX):
-                try:
-                    timestamp_str = line.strip()[len(TIMESTAMP_PREFIX):]
-                    return datetime.strptime(timestamp_str, TIMESTAMP_FORMAT)
-                except ValueError:
-                    return None
-            # Only check first few lines (timestamp should be at the top)
-            if line.strip().startswith('['):
-                break
+
+# The writers put the timestamp on the first line, so read_timestamp only
+# searches the first page of the file instead of reading all of it
+_TIMESTAMP_SEARCH_LIMIT = 4096
+_TIMESTAMP_PREFIX_BYTES = TIMESTAMP_PREFIX.encode('utf-8')
+_SECTION_LINE_BYTES_RE = re.compile(rb'(?:^|\r)\s*\[', re.MULTILINE)
+
+
+def _find_timestamp_in_buffer(buffer) -> Optional[datetime]:
+    """Find the timestamp line near the top of a bytes-like file buffer."""
+    limit = min(len(buffer), _TIMESTAMP_SEARCH_LIMIT)
+    index = buffer.find(_TIMESTAMP_PREFIX_BYTES, 0, limit)
+    while index != -1:
+        line_start = max(buffer.rfind(b'\n', 0, index), buffer.rfind(b'\r', 0, index)) + 1
+        # Only check the header (timestamp must come before the first section)
+        if _SECTION_LINE_BYTES_RE.search(buffer, 0, line_start):
+            return None
+        line_end = buffer.find(b'\n', index)
+        if line_end == -1:
+            line_end = len(buffer)
+        carriage_return = buffer.find(b'\r', index, line_end)
+        if carriage_return != -1:
+            line_end = carriage_return
+        line = buffer[line_start:line_end].decode('utf-8', 'replace').strip()
+        if line.startswith(TIMESTAMP_PREFIX):
+            try:
+                timestamp_str = line[len(TIMESTAMP_PREFIX):]
+                return datetime.strptime(timestamp_str, TIMESTAMP_FORMAT)
+            except ValueError:
+                return None
+        index = buffer.find(_TIMESTAMP_PREFIX_BYTES, index + 1, limit)
     return None
 
 
-def _parse_file_structure(filepath: str) -> tuple:
+def _find_timestamp(lines: list) -> Optional[datetime]:
+    """Find the timestamp line in the lines of an ext_config.ini file."""
+    for line in lines:
+        if line.strip().startswith(TIMESTAMP_PREFIX):
+            try:
+                timestamp_str = line.strip()[len(TIMESTAMP_PREFIX):]
+                return datetime.strptime(timestamp_str, TIMESTAMP_FORMAT)
+            except ValueError:
+                return None
+        # Only check first few lines (timestamp should be at the top)
+        if line.strip().startswith('['):
+            break
+    return None
+
+
+def _structure_of(ini: Optional[_IniFile]) -> tuple:
     """
-    Parse file into structured sections while preserving raw content.
+    Get the file structure of a loaded ext_config.ini, preserving raw content.
 
-    Handles auto-indexed sections (e.g., [SHADER_REPLACEMENT_...]) by converting
-    them to numbered format for consistent handling.
+    Auto-indexed sections (e.g., [SHADER_REPLACEMENT_...]) are converted to
+    numbered format for consistent handling.
+
+    Args:
+        ini: File as returned by _load_ini (None if it doesn't exist)
 
     Returns:
         Tuple of (header_lines, section_blocks, footer_lines)
@@ -308,17 +465,32 @@ def _parse_file_structure(filepath: str) -> tuple:
         - section_blocks: List of (section_name, raw_lines) tuples
         - footer_lines: Lines after last section (text outside any section)
     """
-    if not os.path.exists(filepath):
+    if ini is None:
         return [], [], []
+    # Copy so callers never modify the cached parse
+    return (
+        list(ini.header_lines),
+        [(name, list(raw_lines)) for name, raw_lines in ini.section_blocks],
+        list(ini.footer_lines),
+    )
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
 
+# Line kinds recorded by _split_file_structure for its footer scan
+_LINE_BLANK_OR_COMMENT = 0
+_LINE_KEY_VALUE = 1
+_LINE_TEXT = 2
+
+
+def _split_file_structure(lines: list) -> tuple:
+    """Split the raw lines of ext_config.ini into (header, section blocks, footer)."""
     header_lines = []
     section_blocks = []
     footer_lines = []
     current_section = None
     current_lines = []
+    # Kind of each line in current_lines, classified while the line is already
+    # stripped so the footer scan below never strips a line again
+    current_kinds = bytearray()
     # Track counters for auto-indexed section types
     auto_index_counters = {}
 
@@ -335,20 +507,17 @@ def _parse_file_structure(filepath: str) -> tuple:
                 header_lines = current_lines
 
             # Start new section
-            section_name = stripped[1:-1]
-
-            # Handle auto-indexed sections (e.g., SHADER_REPLACEMENT_...)
-            if section_name.endswith('_...'):
-                prefix = section_name[:-3]  # Remove '...'
-                if prefix not in auto_index_counters:
-                    auto_index_counters[prefix] = 0
-                section_name = f"{prefix}{auto_index_counters[prefix]}"
-                auto_index_counters[prefix] += 1
-
-            current_section = section_name
+            current_section = _resolve_autoindex(stripped[1:-1], auto_index_counters)
             current_lines = [line]
+            current_kinds = bytearray(1)
         else:
             current_lines.append(line)
+            if not stripped or stripped[0] in ';#':
+                current_kinds.append(_LINE_BLANK_OR_COMMENT)
+            elif '=' in stripped:
+                current_kinds.append(_LINE_KEY_VALUE)
+            else:
+                current_kinds.append(_LINE_TEXT)
 
     # Handle remaining content
     if current_section is not None:
@@ -360,21 +529,17 @@ def _parse_file_structure(filepath: str) -> tuple:
     # Check if there's footer content (lines after last section that aren't part of it)
     # This handles text added at the very end of the file outside any section
     if section_blocks:
+        # current_lines/current_kinds still describe the last section
         last_name, last_lines = section_blocks[-1]
-        # Find where section content ends (last non-empty line that's part of section)
+        # Find where section content ends (last key=value line after the header)
         footer_start = len(last_lines)
-        for i in range(len(last_lines) - 1, 0, -1):
-            stripped = last_lines[i].strip()
-            if stripped and not stripped.startswith(';') and not stripped.startswith('#'):
-                if '=' in stripped:
-                    footer_start = i + 1
-                    break
+        last_key_value = current_kinds.rfind(_LINE_KEY_VALUE, 1)
+        if last_key_value != -1:
+            footer_start = last_key_value + 1
 
         # Check if there's actual footer content (non-blank lines after section content)
         potential_footer = last_lines[footer_start:]
-        has_footer_content = any(l.strip() and not l.strip().startswith(';')
-                                 and not l.strip().startswith('#')
-                                 and '=' not in l for l in potential_footer)
+        has_footer_content = current_kinds.find(_LINE_TEXT, footer_start) != -1
 
         if has_footer_content:
             # Move footer content out of last section
@@ -383,30 +548,78 @@ def _parse_file_structure(filepath: str) -> tuple:
 
     # Filter out our generated category headers and timestamp from preserved content
     # This prevents duplicate headers/timestamps on re-export
-    header_lines = _filter_timestamp(_filter_generated_headers(header_lines))
+    header_lines = _remove_lines(header_lines, _GENERATED_HEADER_OR_TIMESTAMP_RE)
     footer_lines = _filter_generated_headers(footer_lines)
 
     return header_lines, section_blocks, footer_lines
 
 
-def _format_section(section_name: str, section_data: dict) -> list:
-    """Format a section as a list of lines."""
+class _IniOutput:
+    """
+    Text buffer for building ext_config.ini output.
+
+    Remembers where the last non-blank chunk ended, so trailing blank lines
+    can be dropped with one truncate instead of popping them off a list.
+    """
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._content_end = 0
+
+    def write(self, text: str) -> None:
+        self._buffer.write(text)
+        if text.strip():
+            self._content_end = self._buffer.tell()
+
+    def writelines(self, lines: list) -> None:
+        for line in lines:
+            self.write(line)
+
+    def getvalue(self) -> str:
+        """Return the output without trailing blank lines, ending in a single newline."""
+        # Strip trailing blank lines to prevent accumulation on each save
+        self._buffer.seek(self._content_end)
+        self._buffer.truncate()
+        text = self._buffer.getvalue()
+        # Ensure file ends with single newline
+        if text and not text.endswith('\n'):
+            text += '\n'
+        return text
+
+
+def _lstrip_blank_lines(lines: list) -> list:
+    """Return lines without their leading blank lines."""
+    start, count = 0, len(lines)
+    while start < count and not lines[start].strip():
+        start += 1
+    return lines[start:]
+
+
+def _rstrip_blank_lines(lines: list) -> list:
+    """Return lines without their trailing blank lines."""
+    end = len(lines)
+    while end > 0 and not lines[end - 1].strip():
+        end -= 1
+    return lines[:end]
+
+
+def _write_section(output: _IniOutput, section_name: str, section_data: dict) -> None:
+    """Format a section straight into the output buffer."""
     # Convert numbered sections to auto-index format for easier user editing
     output_name = section_name
-    if re.match(r'^SHADER_REPLACEMENT_\d+$', section_name):
-        output_name = "SHADER_REPLACEMENT_..."
-    elif re.match(r'^MATERIAL_ADJUSTMENT_\d+$', section_name):
-        output_name = "MATERIAL_ADJUSTMENT_..."
+    prefix, _, suffix = section_name.rpartition('_')
+    if prefix in AUTO_INDEXED_SECTIONS and suffix.isdecimal():
+        output_name = f"{prefix}_..."
 
     # Note: AC INI format uses KEY=VALUE without spaces around =
-    lines = [f"[{output_name}]\n"]
-    for key, value in section_data.items():
-        formatted_value = format_value(value)
-        lines.append(f"{key}={formatted_value}\n")
-    lines.append("\n")
-    return lines
+    output.write(f"[{output_name}]\n" + "".join(
+        [f"{key}={format_value(value)}\n" for key, value in section_data.items()]
+    ))
+    # Blank separator goes in on its own so it can be trimmed at the end of file
+    output.write("\n")
 
 
+@lru_cache(maxsize=2048)
 def _get_category_header(section_name: str) -> Optional[str]:
     """
     Get the category header for a section (if it's the first in its category).
@@ -414,28 +627,70 @@ def _get_category_header(section_name: str) -> Optional[str]:
     Returns the header string or None if no header needed.
     """
     # Check exact matches first
-    if section_name in SECTION_CATEGORIES:
-        return SECTION_CATEGORIES[section_name]
+    header = SECTION_CATEGORIES.get(section_name)
+    if header is not None:
+        return header
 
     # Check prefix matches for numbered sections
-    for prefix, header in SECTION_CATEGORIES.items():
-        if prefix.endswith('_') and section_name.startswith(prefix):
-            return header
+    if section_name.startswith(_CATEGORY_PREFIXES):
+        for prefix, header in _CATEGORY_PREFIX_ENTRIES:
+            if section_name.startswith(prefix):
+                return header
 
     return None
 
 
+@lru_cache(maxsize=2048)
 def _get_category_key(section_name: str) -> str:
     """Get the category key for a section (for tracking which headers we've written)."""
     # Check prefix matches for numbered sections
-    for prefix in SECTION_CATEGORIES.keys():
-        if prefix.endswith('_') and section_name.startswith(prefix):
-            return prefix
+    if section_name.startswith(_CATEGORY_PREFIXES):
+        for prefix in _CATEGORY_PREFIXES:
+            if section_name.startswith(prefix):
+                return prefix
 
     # Exact match
     return section_name
 
 
+def _write_if_changed(filepath: str, body: str, ini: Optional[_IniFile]) -> bool:
+    """
+    Write body to filepath behind a fresh timestamp line.
+
+    The write is skipped when the file already holds the same content apart
+    from its timestamp, so a no-op save leaves the file and its mtime alone.
+
+    Args:
+        filepath: Output path
+        body: File content without the timestamp line
+        ini: Current file as returned by _load_ini (None if it doesn't exist)
+
+    Returns:
+        True if the file was written
+    """
+    if ini is None:
+        # Ensure directory exists (an existing file implies it does)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    elif _TIMESTAMP_RE.sub('', ''.join(ini.lines)) == body:
+        return False
+
+    # Write next to the target and swap it in, so an interrupted save never
+    # leaves a truncated ext_config.ini behind
+    tmp_path = filepath + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(_generate_timestamp_line())
+            f.write(body)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    finally:
+        _load_ini_cached.cache_clear()
+    return True
+
+
 def write_ext_config(filepath: str, sections: dict,
                      preserve_sections: Optional[list] = None) -> None:
     """
@@ -457,10 +712,11 @@ def write_ext_config(filepath: str, sections: dict,
 
     # Use ALL managed sections/prefixes - this ensures removed sections are deleted
     # (not accidentally preserved as "unmanaged")
-    managed_prefixes = [s for s in ALL_MANAGED_SECTIONS if s not in preserve_sections]
+    managed_prefixes = tuple(s for s in ALL_MANAGED_SECTIONS if s not in preserve_sections)
 
     # Parse existing file structure
-    header_lines, section_blocks, footer_lines = _parse_file_structure(filepath)
+    ini = _load_ini(filepath)
+    header_lines, section_blocks, footer_lines = _structure_of(ini)
 
     # Collect preserved sections from existing file
     preserved_blocks = {}
@@ -473,32 +729,26 @@ def write_ext_config(filepath: str, sections: dict,
             # Unknown section - preserve it (user's custom section)
             unmanaged_blocks.append((section_name, raw_lines))
 
-    # Merge preserved sections into output
-    output_sections = dict(sections)
-
-    # Add preserved section names so they appear in sorted output
-    for section_name in preserve_sections:
-        if section_name in preserved_blocks and section_name not in output_sections:
-            output_sections[section_name] = {}  # Placeholder - actual content from preserved_blocks
+    # Merge preserved sections into output, adding preserved section names so
+    # they appear in sorted output (placeholder - actual content from preserved_blocks)
+    output_sections = {
+        **sections,
+        **{section_name: {} for section_name in preserve_sections
+           if section_name in preserved_blocks and section_name not in sections},
+    }
 
     # Sort sections for output
     sorted_names = sort_sections(output_sections)
 
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
     # Build output
-    output_lines = []
-
-    # Add timestamp as the very first line
-    output_lines.append(_generate_timestamp_line())
+    output = _IniOutput()
 
     # Add header (preserved comments/text before first section)
     if header_lines:
-        output_lines.extend(header_lines)
+        output.writelines(header_lines)
         # Add blank line after user header before our content
-        if not output_lines[-1].endswith('\n\n'):
-            output_lines.append('\n')
+        if not header_lines[-1].endswith('\n\n'):
+            output.write('\n')
 
     # Track which category headers we've written
     written_categories = set()
@@ -510,47 +760,35 @@ def write_ext_config(filepath: str, sections: dict,
         if category_key not in written_categories:
             header = _get_category_header(section_name)
             if header:
-                output_lines.append(header)
+                output.write(header)
             written_categories.add(category_key)
 
         if section_name in preserve_sections and section_name in preserved_blocks:
             # Write preserved raw content (filter out our generated headers to avoid duplicates)
             filtered_lines = _filter_generated_headers(preserved_blocks[section_name])
-            output_lines.extend(filtered_lines)
+            output.writelines(filtered_lines)
         else:
             # Write new section data
             section_data = output_sections[section_name]
-            output_lines.extend(_format_section(section_name, section_data))
+            _write_section(output, section_name, section_data)
 
     # Always add USER CUSTOM SECTIONS header at the end
     # This provides a clear place for users to add their own configurations
-    output_lines.append(USER_SECTIONS_HEADER)
+    output.write(USER_SECTIONS_HEADER)
 
     # Add any unmanaged sections (user's custom sections)
     for section_name, raw_lines in unmanaged_blocks:
         # Filter out our generated headers from raw content
         filtered_lines = _filter_generated_headers(raw_lines)
         # Strip leading blank lines to prevent accumulation
-        while filtered_lines and filtered_lines[0].strip() == '':
-            filtered_lines.pop(0)
-        output_lines.extend(filtered_lines)
+        output.writelines(_lstrip_blank_lines(filtered_lines))
 
     # Add footer (preserved text after last section)
     # Strip leading blank lines to prevent accumulation
-    while footer_lines and footer_lines[0].strip() == '':
-        footer_lines.pop(0)
-    output_lines.extend(footer_lines)
+    output.writelines(_lstrip_blank_lines(footer_lines))
 
-    # Strip trailing blank lines to prevent accumulation on each save
-    while output_lines and output_lines[-1].strip() == '':
-        output_lines.pop()
-    # Ensure file ends with single newline
-    if output_lines and not output_lines[-1].endswith('\n'):
-        output_lines[-1] += '\n'
-
-    # Write file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.writelines(output_lines)
+    # Write file (timestamp goes in as the very first line)
+    _write_if_changed(filepath, output.getvalue(), ini)
 
 
 def update_sections(filepath: str, sections: dict,
@@ -575,49 +813,37 @@ def update_sections(filepath: str, sections: dict,
                          (e.g., ['LIGHT_', 'LIGHT_SERIES_', 'LIGHTING'] for lights)
     """
     # Parse existing file structure
-    header_lines, section_blocks, footer_lines = _parse_file_structure(filepath)
+    ini = _load_ini(filepath)
+    header_lines, section_blocks, footer_lines = _structure_of(ini)
 
     # Separate preserved vs managed sections, and identify user custom sections
     preserved_blocks = {}  # Known addon sections to preserve
     unmanaged_blocks = []  # User custom sections (unknown to addon)
+    managed_prefixes = tuple(managed_prefixes)
 
     for section_name, raw_lines in section_blocks:
         if not _is_managed_section(section_name, managed_prefixes):
             # Check if it's a known addon section or a user custom section
-            if _is_managed_section(section_name, ALL_MANAGED_SECTIONS):
+            if _is_managed_section(section_name, _ALL_MANAGED_PREFIXES):
                 # Known addon section, preserve it
                 preserved_blocks[section_name] = raw_lines
             else:
                 # User custom section
                 unmanaged_blocks.append((section_name, raw_lines))
 
-    # Combine preserved and new sections
-    all_sections = {}
-
-    # Add preserved sections (parse raw content to get section data for sorting)
-    for section_name, raw_lines in preserved_blocks.items():
-        section_data = {}
-        for line in raw_lines:
-            stripped = line.strip()
-            if '=' in stripped and not stripped.startswith(';') and not stripped.startswith('#'):
-                key, _, value = stripped.partition('=')
-                section_data[key.strip()] = value.strip()
-        all_sections[section_name] = section_data
-
-    # Add new/updated sections
-    all_sections.update(sections)
+    # Combine preserved and new/updated sections (section data for preserved
+    # sections comes from the parse cached with the file, so the raw lines
+    # aren't scanned again)
+    all_sections = {
+        **{section_name: ini.sections.get(section_name, {}) for section_name in preserved_blocks},
+        **sections,
+    }
 
     # Sort all sections
     sorted_names = sort_sections(all_sections)
 
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
     # Build output
-    output_lines = []
-
-    # Add timestamp as the very first line
-    output_lines.append(_generate_timestamp_line())
+    output = _IniOutput()
 
     # Track which category headers we've written
     written_categories = set()
@@ -629,49 +855,35 @@ def update_sections(filepath: str, sections: dict,
         if category_key not in written_categories:
             header = _get_category_header(section_name)
             if header:
-                output_lines.append(header)
+                output.write(header)
             written_categories.add(category_key)
 
         if section_name in preserved_blocks:
             # Write preserved raw content (filter out our generated headers to avoid duplicates)
             filtered_lines = _filter_generated_headers(preserved_blocks[section_name])
             # Strip trailing blank lines to prevent accumulation
-            while filtered_lines and filtered_lines[-1].strip() == '':
-                filtered_lines.pop()
-            output_lines.extend(filtered_lines)
-            output_lines.append('\n')  # Add single trailing newline
+            output.writelines(_rstrip_blank_lines(filtered_lines))
+            output.write('\n')  # Add single trailing newline
         else:
             # Write new section
-            output_lines.extend(_format_section(section_name, sections[section_name]))
+            _write_section(output, section_name, sections[section_name])
 
     # Always add USER CUSTOM SECTIONS header at the end
-    output_lines.append(USER_SECTIONS_HEADER)
+    output.write(USER_SECTIONS_HEADER)
 
     # Add any unmanaged sections (user's custom sections)
     for section_name, raw_lines in unmanaged_blocks:
         # Filter out our generated headers from raw content
         filtered_lines = _filter_generated_headers(raw_lines)
         # Strip leading blank lines to prevent accumulation
-        while filtered_lines and filtered_lines[0].strip() == '':
-            filtered_lines.pop(0)
-        output_lines.extend(filtered_lines)
+        output.writelines(_lstrip_blank_lines(filtered_lines))
 
     # Add footer (preserved text after last section)
     # Strip leading blank lines to prevent accumulation
-    while footer_lines and footer_lines[0].strip() == '':
-        footer_lines.pop(0)
-    output_lines.extend(footer_lines)
+    output.writelines(_lstrip_blank_lines(footer_lines))
 
-    # Strip trailing blank lines to prevent accumulation on each save
-    while output_lines and output_lines[-1].strip() == '':
-        output_lines.pop()
-    # Ensure file ends with single newline
-    if output_lines and not output_lines[-1].endswith('\n'):
-        output_lines[-1] += '\n'
-
-    # Write file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.writelines(output_lines)
+    # Write file (timestamp goes in as the very first line)
+    _write_if_changed(filepath, output.getvalue(), ini)
 
 
 # =============================================================================
@@ -685,39 +897,83 @@ def build_include_section() -> dict:
     }
 
 
-def collect_all_sections(context, include_shader_replacements: bool = True) -> dict:
-    """
-    Collect all ext_config sections from addon settings.
+class _NumberedKeys(dict):
+    """Interned '<prefix><n>' section/key names by index, built on first use."""
 
-    This is the main aggregation function that gathers data from all
-    PropertyGroups and builds the complete ext_config structure.
+    def __init__(self, prefix: str):
+        super().__init__()
+        self.prefix = prefix
 
-    Args:
-        context: Blender context
-        include_shader_replacements: Whether to include SHADER_REPLACEMENT sections
+    def __missing__(self, index: int) -> str:
+        key = self[index] = sys.intern(f"{self.prefix}{index}")
+        return key
 
-    Returns:
-        Dict of all sections ready for writing
+
+# Numbered names reused across collects instead of formatting them each time
+_LIGHT_KEYS = _NumberedKeys("LIGHT_")
+_LIGHT_SERIES_KEYS = _NumberedKeys("LIGHT_SERIES_")
+_MATERIAL_ADJUSTMENT_KEYS = _NumberedKeys("MATERIAL_ADJUSTMENT_")
+_SHADER_REPLACEMENT_KEYS = _NumberedKeys("SHADER_REPLACEMENT_")
+_PROP_KEYS = _NumberedKeys("PROP_")
+
+
+# collect_all_sections output, cached per bucket in output order. A bucket is
+# rebuilt only while it is marked dirty (see invalidate_sections_cache).
+_SECTION_BUCKETS = ("grassfx", "rainfx", "lighting", "shaders", "extensions")
+# Buckets whose output also depends on bpy.data.materials
+_MATERIAL_BUCKETS = frozenset({"grassfx", "lighting", "shaders"})
+# "version" goes up whenever buckets are marked dirty
+_sections_cache = {"scene": None, "data": {}, "dirty": set(_SECTION_BUCKETS), "version": 0}
+
+
+def invalidate_sections_cache(depsgraph=None) -> None:
     """
-    settings = context.scene.AC_Settings
-    sections = {}
+    Mark sections cached by collect_all_sections as out of date.
 
-    # 1. INCLUDE section (always present)
-    sections["INCLUDE"] = build_include_section()
+    Called from the depsgraph_update_post handler. Updates that only touch
+    materials mark just the buckets built from materials, anything else marks
+    everything. Without a depsgraph (file load, undo, import) everything is
+    marked.
 
-    # 2. GRASS_FX
-    grassfx_dict = settings.grassfx.to_dict()
-    if grassfx_dict:
-        sections.update(grassfx_dict)
+    Code that changes addon settings and collects again before Blender has
+    evaluated the depsgraph must call this itself. So must operators that
+    add, remove, move or clear collection items: collection edits do not tag
+    the owning ID, so no depsgraph update follows them.
+    """
+    cache = _sections_cache
+    dirty = cache["dirty"]
+    if depsgraph is None:
+        dirty.update(_SECTION_BUCKETS)
+        cache["version"] += 1
+        return
+    updates = depsgraph.updates
+    if not updates:
+        return
+    cache["version"] += 1
+    if all(update.id.id_type == 'MATERIAL' for update in updates):
+        dirty.update(_MATERIAL_BUCKETS)
+    else:
+        dirty.update(_SECTION_BUCKETS)
+
+
+def _collect_grassfx_sections(context) -> dict:
+    """Collect the GRASS_FX section."""
+    settings = context.scene.AC_Settings
+    return settings.grassfx.to_dict()
 
-    # 3. RAIN_FX
+
+def _collect_rainfx_sections(context) -> dict:
+    """Collect the RAIN_FX section."""
+    settings = context.scene.AC_Settings
     rainfx_dict = settings.rainfx.to_dict()
-    if rainfx_dict:
-        sections["RAIN_FX"] = rainfx_dict
+    return {"RAIN_FX": rainfx_dict} if rainfx_dict else {}
 
-    # 4. TREES - NOT included here, managed by TreeFX operator only
 
-    # 5. CSP LIGHTS
+def _collect_lighting_sections(context) -> dict:
+    """Collect LIGHTING, LIGHT_*, LIGHT_SERIES_* and MATERIAL_ADJUSTMENT_* sections."""
+    settings = context.scene.AC_Settings
+    sections = {}
+
     # Global lighting settings
     sections["LIGHTING"] = settings.lighting.global_lighting.to_dict()
 
@@ -729,39 +985,84 @@ def collect_all_sections(context, include_shader_replacements: bool = True) -> d
             continue
         light_data = light.to_dict()
         if light.light_type == "SERIES":
-            sections[f"LIGHT_SERIES_{series_index}"] = light_data
+            sections[_LIGHT_SERIES_KEYS[series_index]] = light_data
             series_index += 1
         else:
-            sections[f"LIGHT_{spot_index}"] = light_data
+            sections[_LIGHT_KEYS[spot_index]] = light_data
             spot_index += 1
 
-    # 7. EMISSIVE MATERIALS
+    # Emissive materials
     emissive_light_offset = spot_index  # Continue LIGHT_ numbering for emit_light
     for idx, emissive in enumerate(settings.lighting.emissive_materials):
         if not emissive.active:
             continue
 
         # MATERIAL_ADJUSTMENT for visual glow
-        sections[f"MATERIAL_ADJUSTMENT_{idx}"] = emissive.to_dict()
+        sections[_MATERIAL_ADJUSTMENT_KEYS[idx]] = emissive.to_dict()
 
         # LIGHT_X entries for emit_light enabled emissives
         if emissive.emit_light:
             for light_data in emissive.to_light_dicts():
-                sections[f"LIGHT_{emissive_light_offset}"] = light_data
+                sections[_LIGHT_KEYS[emissive_light_offset]] = light_data
                 emissive_light_offset += 1
 
-    # 8. SHADER REPLACEMENTS
-    if include_shader_replacements:
-        shader_sections = _collect_shader_replacements(context)
-        sections.update(shader_sections)
+    return sections
+
 
-    # 9. GLOBAL EXTENSIONS (custom user sections)
+def _collect_extension_sections(context) -> dict:
+    """Collect global extensions (custom user sections)."""
+    settings = context.scene.AC_Settings
+    sections = {}
     for extension in settings.global_extensions:
         ext_data = {}
         for item in extension.items:
             ext_data[item.key] = item.value
         if ext_data:
             sections[extension.name] = ext_data
+    return sections
+
+
+def collect_all_sections(context, include_shader_replacements: bool = True) -> dict:
+    """
+    Collect all ext_config sections from addon settings.
+
+    This is the main aggregation function that gathers data from all
+    PropertyGroups and builds the complete ext_config structure.
+
+    Sections are cached per bucket (GrassFX, RainFX, lighting, shader
+    replacements, extensions); only buckets marked dirty since the last call
+    are collected again.
+
+    Args:
+        context: Blender context
+        include_shader_replacements: Whether to include SHADER_REPLACEMENT sections
+
+    Returns:
+        Dict of all sections ready for writing
+    """
+    cache = _sections_cache
+    dirty = cache["dirty"]
+    bucket_sections = cache["data"]
+
+    # A different scene shares nothing with the cached one
+    scene_key = context.scene.as_pointer()
+    if cache["scene"] != scene_key:
+        cache["scene"] = scene_key
+        dirty.update(_SECTION_BUCKETS)
+
+    # INCLUDE section (always present), then GRASS_FX, RAIN_FX, lighting
+    # (TREES is NOT included here, managed by TreeFX operator only),
+    # SHADER_REPLACEMENT_* and global extensions
+    sections = {"INCLUDE": build_include_section()}
+    for bucket in _SECTION_BUCKETS:
+        if bucket == "shaders" and not include_shader_replacements:
+            continue
+        if bucket in dirty:
+            bucket_sections[bucket] = _SECTION_COLLECTORS[bucket](context)
+            dirty.discard(bucket)
+        # Copy so callers can't modify the cached sections
+        for section_name, section_data in bucket_sections[bucket].items():
+            sections[section_name] = dict(section_data)
 
     return sections
 
@@ -790,10 +1091,10 @@ def collect_light_sections(context) -> dict:
             continue
         light_data = light.to_dict()
         if light.light_type == "SERIES":
-            sections[f"LIGHT_SERIES_{series_index}"] = light_data
+            sections[_LIGHT_SERIES_KEYS[series_index]] = light_data
             series_index += 1
         else:
-            sections[f"LIGHT_{spot_index}"] = light_data
+            sections[_LIGHT_KEYS[spot_index]] = light_data
             spot_index += 1
 
     return sections
@@ -818,12 +1119,12 @@ def collect_emissive_sections(context) -> dict:
             continue
 
         # MATERIAL_ADJUSTMENT for visual glow
-        sections[f"MATERIAL_ADJUSTMENT_{idx}"] = emissive.to_dict()
+        sections[_MATERIAL_ADJUSTMENT_KEYS[idx]] = emissive.to_dict()
 
         # LIGHT_X entries for emit_light enabled emissives
         if emissive.emit_light:
             for light_data in emissive.to_light_dicts():
-                sections[f"LIGHT_{light_index}"] = light_data
+                sections[_LIGHT_KEYS[light_index]] = light_data
                 light_index += 1
 
     return sections
@@ -833,6 +1134,10 @@ def collect_emissive_sections(context) -> dict:
 # HELPERS
 # =============================================================================
 
+# (fingerprint, sections) of the last _collect_shader_replacements result
+_shader_cache = [None, None]
+
+
 def _collect_shader_replacements(context) -> dict:
     """
     Collect SHADER_REPLACEMENT sections for material property overrides.
@@ -840,46 +1145,34 @@ def _collect_shader_replacements(context) -> dict:
     Always adds a global LOD section as SHADER_REPLACEMENT_0 that applies to all meshes.
     Then includes material-specific shader replacements.
     Includes ksTree flag as the final SHADER_REPLACEMENT_N if any ksTree materials exist.
+
+    The material data read here doubles as a fingerprint; when it matches the
+    previous call the sections built then are returned without formatting.
     """
     import bpy
     from ...utils.helpers import get_visible_materials
 
-    sections = {}
-
-    # Always add global LOD settings as the first SHADER_REPLACEMENT_0
-    sections["SHADER_REPLACEMENT_0"] = {
-        "ACTIVE": 1,
-        "MESHES": "?",
-        "LOD_IN": 0,
-        "LOD_OUT": 500,
-    }
-
-    # Start material-specific shader replacements from index 1
-    idx = 1
     has_kstree = False
+    material_entries = []
 
     # Get visible material names to filter by
     visible_material_names = get_visible_materials(context)
 
     for material in bpy.data.materials:
-        # Skip materials without node trees or hidden materials
-        if not material.node_tree or is_hidden_name(material.name):
-            continue
-
-        # Skip unused materials
-        if material.users == 0:
+        # Skip materials not on visible objects (get_visible_materials
+        # already leaves out hidden materials)
+        material_name = material.name
+        if material_name not in visible_material_names:
             continue
 
-        # Skip materials not on visible objects
-        if material.name not in visible_material_names:
+        # Skip materials without node trees and unused materials
+        if not material.node_tree or material.users == 0:
             continue
 
-        # Check if material has AC settings
-        if not hasattr(material, 'AC_Material'):
-            continue
-
-        ac_mat = material.AC_Material
-        shader_name = ac_mat.shader_name
+        # AC_Material is registered on every Material while the addon is enabled
+        # (one snapshot per material instead of repeated RNA reads)
+        snapshot = material.AC_Material.snapshot()
+        shader_name = snapshot.shader_name
         if not shader_name:
             continue
 
@@ -888,35 +1181,42 @@ def _collect_shader_replacements(context) -> dict:
             has_kstree = True
             continue  # Don't create individual shader replacements for ksTree
 
+        material_entries.append((material_name, shader_name, snapshot.shader_properties))
+
+    fingerprint = (tuple(material_entries), has_kstree)
+    if _shader_cache[0] == fingerprint:
+        return _shader_cache[1]
+
+    sections = {}
+
+    # Always add global LOD settings as the first SHADER_REPLACEMENT_0
+    sections["SHADER_REPLACEMENT_0"] = {
+        "ACTIVE": 1,
+        "MESHES": "?",
+        "LOD_IN": 0,
+        "LOD_OUT": 500,
+    }
+
+    # Start material-specific shader replacements from index 1
+    idx = 1
+
+    for material_name, shader_name, props in material_entries:
         # Build section data
         section_data = {
-            "MATERIALS": material.name,
+            "MATERIALS": material_name,
             "SHADER": shader_name,
         }
 
         # Add shader properties
-        prop_idx = 0
-        for prop in ac_mat.shader_properties:
-            if prop.property_type == 'float':
-                value = format_value(prop.valueA)
-            elif prop.property_type == 'vec2':
-                value = f"{format_value(prop.valueB[0])}, {format_value(prop.valueB[1])}"
-            elif prop.property_type == 'vec3':
-                value = f"{format_value(prop.valueC[0])}, {format_value(prop.valueC[1])}, {format_value(prop.valueC[2])}"
-            elif prop.property_type == 'vec4':
-                value = f"{format_value(prop.valueD[0])}, {format_value(prop.valueD[1])}, {format_value(prop.valueD[2])}, {format_value(prop.valueD[3])}"
-            else:
-                continue
-
-            section_data[f"PROP_{prop_idx}"] = f"{prop.name}, {value}"
-            prop_idx += 1
+        for prop_idx, (prop_name, _prop_type, value) in enumerate(props):
+            section_data[_PROP_KEYS[prop_idx]] = f"{prop_name}, {format_value(value)}"
 
-        sections[f"SHADER_REPLACEMENT_{idx}"] = section_data
+        sections[_SHADER_REPLACEMENT_KEYS[idx]] = section_data
         idx += 1
 
     # Add ksTree flag as the final SHADER_REPLACEMENT if any ksTree materials exist
     if has_kstree:
-        sections[f"SHADER_REPLACEMENT_{idx}"] = {
+        sections[_SHADER_REPLACEMENT_KEYS[idx]] = {
             "MATERIALS": "shader:ksTree?",
             "MATERIAL_FLAG_0": "1",
             "PROP_0": f"ksAmbient, {format_value(0.18)}",
@@ -925,9 +1225,20 @@ def _collect_shader_replacements(context) -> dict:
             "PROP_3": f"ksSpecularEXP, {format_value(50.0)}",
         }
 
+    _shader_cache[0] = fingerprint
+    _shader_cache[1] = sections
     return sections
 
 
+_SECTION_COLLECTORS = {
+    "grassfx": _collect_grassfx_sections,
+    "rainfx": _collect_rainfx_sections,
+    "lighting": _collect_lighting_sections,
+    "shaders": _collect_shader_replacements,
+    "extensions": _collect_extension_sections,
+}
+
+
 def get_ext_config_path(settings) -> str:
     """Get the path to ext_config.ini from settings."""
     return os.path.join(settings.working_dir, "extension", "ext_config.ini")
@@ -937,13 +1248,22 @@ def get_ext_config_path(settings) -> str:
 # COMPARISON / SYNC
 # =============================================================================
 
+_COMMA_RE = re.compile(r'\s*,\s*')
+
+
 def _normalize_value(value) -> str:
     """Normalize a value for comparison (handles formatting differences)."""
     if value is None:
         return ""
     s = str(value).strip()
+    # Fast path for scalars (most values)
+    if ',' not in s:
+        try:
+            return f"{float(s):.6f}".rstrip('0').rstrip('.')
+        except ValueError:
+            return s
     # Normalize whitespace around commas
-    s = re.sub(r'\s*,\s*', ', ', s)
+    s = _COMMA_RE.sub(', ', s)
     # Normalize trailing zeros in floats
     parts = s.split(', ')
     normalized_parts = []
@@ -966,27 +1286,45 @@ def _compare_section_values(file_section: dict, addon_section: dict) -> list:
     Returns:
         List of change dicts: [{"key": str, "file": str, "addon": str}, ...]
     """
+    # Unchanged section: equal raw values can't differ once normalized
+    if file_section == addon_section:
+        return []
+
     changes = []
-    all_keys = set(file_section.keys()) | set(addon_section.keys())
+    all_keys = file_section.keys() | addon_section.keys()
+
+    # Keys are only put in order for the changes actually reported
+    for key in all_keys:
+        file_val = file_section.get(key, "")
+        addon_val = addon_section.get(key, "")
 
-    for key in sorted(all_keys):
-        file_val = _normalize_value(file_section.get(key, ""))
-        addon_val = _normalize_value(addon_section.get(key, ""))
+        # Identical text needs no normalizing (the common, unchanged case)
+        if file_val == addon_val:
+            continue
 
-        if file_val != addon_val:
+        if _normalize_value(file_val) != _normalize_value(addon_val):
             changes.append({
                 "key": key,
                 "file": file_section.get(key, "(not in file)"),
                 "addon": addon_section.get(key, "(not in addon)")
             })
 
+    changes.sort(key=itemgetter("key"))
     return changes
 
 
+# Last compare_with_file result, with the cache key and file it was built from
+_last_diff = {"key": None, "ini": None, "result": None}
+
+
 def compare_with_file(context, include_shader_replacements: bool = True) -> dict:
     """
     Compare current addon state with ext_config.ini file.
 
+    While neither the file nor the addon sections have changed since the last
+    call (no buckets marked dirty in between), a copy of the previous result
+    is returned instead of comparing again.
+
     Returns:
         Dict with structure:
         {
@@ -1007,8 +1345,24 @@ def compare_with_file(context, include_shader_replacements: bool = True) -> dict
     settings = context.scene.AC_Settings
     filepath = get_ext_config_path(settings)
 
+    ini = _load_ini(filepath)
+
+    cache_key = (filepath, context.scene.as_pointer(), include_shader_replacements,
+                 _sections_cache["version"])
+    if _last_diff["key"] == cache_key and _last_diff["ini"] is ini:
+        return copy.deepcopy(_last_diff["result"])
+    result = _compare_with_file(context, include_shader_replacements, ini)
+    _last_diff["key"] = cache_key
+    _last_diff["ini"] = ini
+    _last_diff["result"] = copy.deepcopy(result)
+    return result
+
+
+def _compare_with_file(context, include_shader_replacements: bool,
+                       ini: Optional[_IniFile]) -> dict:
+    """Build the compare_with_file result for the loaded file (None if missing)."""
     result = {
-        "has_file": os.path.exists(filepath),
+        "has_file": ini is not None,
         "has_differences": False,
         "file_timestamp": None,
         "sections": {}
@@ -1030,24 +1384,28 @@ def compare_with_file(context, include_shader_replacements: bool = True) -> dict
         result["has_differences"] = len(result["sections"]) > 0
         return result
 
-    # Read file
-    result["file_timestamp"] = read_timestamp(filepath)
-    file_sections = parse_ext_config(filepath)
+    # Read file (the parse is cached by path, mtime and size; it is only
+    # read here, and the sections that go into the result are copied)
+    result["file_timestamp"] = ini.timestamp
+    file_sections = ini.sections
     addon_sections = collect_all_sections(context, include_shader_replacements)
 
-    # Get all section names from both sources (excluding certain auto-generated sections)
+    # Get all section names from both sources (excluding certain auto-generated
+    # sections), addon ones first in collect order, then file-only ones
     skip_sections = {"INCLUDE", "TREES"}
-    file_section_names = {k for k in file_sections.keys() if k not in skip_sections}
-    addon_section_names = {k for k in addon_sections.keys() if k not in skip_sections}
-
-    # Also skip user-defined sections (not managed by addon)
-    for name in list(file_section_names):
-        if not _is_managed_section(name, ALL_MANAGED_SECTIONS):
-            file_section_names.discard(name)
-
-    all_section_names = file_section_names | addon_section_names
-
-    for section_name in sorted(all_section_names, key=get_section_sort_key):
+    all_section_names = [k for k in addon_sections if k not in skip_sections]
+    # Also skip user-defined sections (not managed by addon) from the file
+    all_section_names.extend(
+        k for k in file_sections
+        if k not in skip_sections and k not in addon_sections
+        and _is_managed_section(k, _ALL_MANAGED_PREFIXES)
+    )
+
+    # The sync dialog and diff summary list sections in this order. The sort
+    # keys are cached, and ties now keep the deterministic order above.
+    all_section_names.sort(key=get_section_sort_key)
+
+    for section_name in all_section_names:
         in_file = section_name in file_sections
         in_addon = section_name in addon_sections
 
@@ -1072,7 +1430,7 @@ def compare_with_file(context, include_shader_replacements: bool = True) -> dict
 
         result["sections"][section_name] = {
             "status": status,
-            "file_values": file_data,
+            "file_values": dict(file_data),
             "addon_values": addon_data_str,
             "changes": changes
         }
@@ -1176,6 +1534,14 @@ def _preprocess_section_data(section_data: dict) -> dict:
     return result
 
 
+# Numbered sections read by import_from_file, split into prefix and index.
+# LIGHT_SERIES_ is listed before LIGHT_ so it wins; the index is left to
+# int() so anything it accepts still imports.
+_IMPORTED_SECTION_RE = re.compile(
+    r'(LIGHT_SERIES_|LIGHT_|MATERIAL_ADJUSTMENT_|SHADER_REPLACEMENT_)(.*)', re.DOTALL
+)
+
+
 def import_from_file(context) -> tuple[bool, str]:
     """
     Import ext_config.ini values into addon PropertyGroups.
@@ -1199,14 +1565,19 @@ def import_from_file(context) -> tuple[bool, str]:
         Tuple of (success, message)
     """
     import bpy
+    from .kn5.material import VALUE_SETTERS
 
     settings = context.scene.AC_Settings
     filepath = get_ext_config_path(settings)
 
-    if not os.path.exists(filepath):
+    ini = _load_ini(filepath)
+    if ini is None:
         return (False, "ext_config.ini not found")
 
-    sections = parse_ext_config(filepath)
+    sections = _sections_of(ini)
+
+    # Settings and materials are rewritten in place below
+    invalidate_sections_cache()
 
     imported_count = 0
     shader_updated_count = 0
@@ -1227,28 +1598,36 @@ def import_from_file(context) -> tuple[bool, str]:
         settings.lighting.global_lighting.from_dict(processed)
         imported_count += 1
 
+    # Sort numbered sections into lights, emissives and shader replacements
+    # in a single pass over the file
+    light_sections = []
+    emissive_sections = []
+    shader_sections = []
+    for section_name, section_data in sections.items():
+        match = _IMPORTED_SECTION_RE.match(section_name)
+        if match is None:
+            continue
+        prefix, suffix = match.groups()
+        if prefix == "SHADER_REPLACEMENT_":
+            shader_sections.append(section_data)
+            continue
+        try:
+            idx = int(suffix)
+        except ValueError:
+            continue
+        if prefix == "MATERIAL_ADJUSTMENT_":
+            emissive_sections.append((idx, section_name, section_data))
+        elif prefix == "LIGHT_SERIES_":
+            light_sections.append(("series", idx, section_name, section_data))
+        else:
+            light_sections.append(("light", idx, section_name, section_data))
+
     # 4. Import LIGHT_N and LIGHT_SERIES_N
     # First, clear existing lights
     settings.lighting.lights.clear()
 
-    # Collect and sort light sections
-    light_sections = []
-    for section_name, section_data in sections.items():
-        if section_name.startswith("LIGHT_SERIES_"):
-            try:
-                idx = int(section_name[len("LIGHT_SERIES_"):])
-                light_sections.append(("series", idx, section_name, section_data))
-            except ValueError:
-                pass
-        elif section_name.startswith("LIGHT_") and not section_name.startswith("LIGHTING"):
-            try:
-                idx = int(section_name[len("LIGHT_"):])
-                light_sections.append(("light", idx, section_name, section_data))
-            except ValueError:
-                pass
-
     # Sort and import
-    light_sections.sort(key=lambda x: (x[0], x[1]))
+    light_sections.sort(key=itemgetter(0, 1))
     for light_type, idx, section_name, section_data in light_sections:
         light = settings.lighting.lights.add()
         processed = _preprocess_section_data(section_data)
@@ -1259,28 +1638,15 @@ def import_from_file(context) -> tuple[bool, str]:
     # First, clear existing
     settings.lighting.emissive_materials.clear()
 
-    # Collect and sort
-    emissive_sections = []
-    for section_name, section_data in sections.items():
-        if section_name.startswith("MATERIAL_ADJUSTMENT_"):
-            try:
-                idx = int(section_name[len("MATERIAL_ADJUSTMENT_"):])
-                emissive_sections.append((idx, section_name, section_data))
-            except ValueError:
-                pass
-
     # Sort and import
-    emissive_sections.sort(key=lambda x: x[0])
+    emissive_sections.sort(key=itemgetter(0))
     for idx, section_name, section_data in emissive_sections:
         emissive = settings.lighting.emissive_materials.add()
         emissive.from_dict(section_data)
         imported_count += 1
 
     # 6. Import SHADER_REPLACEMENT_N (Material shader properties)
-    for section_name, section_data in sections.items():
-        if not section_name.startswith("SHADER_REPLACEMENT_"):
-            continue
-
+    for section_data in shader_sections:
         material_name = section_data.get("MATERIALS", "")
         if not material_name:
             continue
@@ -1308,42 +1674,37 @@ def import_from_file(context) -> tuple[bool, str]:
                 prop_value = value[comma_idx + 1:].strip()
                 props_to_import[prop_name] = prop_value
 
+        # Index existing properties by name once (first match wins, like a
+        # linear search). Indices rather than items are kept because add()
+        # can reallocate the collection and invalidate item references.
+        shader_properties = ac_mat.shader_properties
+        prop_indices = {}
+        for prop_index, prop in enumerate(shader_properties):
+            prop_indices.setdefault(prop.name, prop_index)
+
         # Update existing properties or add new ones
         for prop_name, prop_value_str in props_to_import.items():
-            # Find existing property
-            existing_prop = None
-            for prop in ac_mat.shader_properties:
-                if prop.name == prop_name:
-                    existing_prop = prop
-                    break
-
-            if not existing_prop:
+            prop_index = prop_indices.get(prop_name)
+            if prop_index is not None:
+                existing_prop = shader_properties[prop_index]
+            else:
                 # Add new property
-                existing_prop = ac_mat.shader_properties.add()
+                existing_prop = shader_properties.add()
                 existing_prop.name = prop_name
+                prop_indices[prop_name] = len(shader_properties) - 1
 
             # Parse and set value
-            values = [v.strip() for v in prop_value_str.split(',')]
+            # (components past the fourth are ignored)
+            values = prop_value_str.split(',', 4)[:4]
             try:
-                if len(values) == 1:
-                    existing_prop.property_type = 'float'
-                    existing_prop.valueA = float(values[0])
-                elif len(values) == 2:
-                    existing_prop.property_type = 'vec2'
-                    existing_prop.valueB = (float(values[0]), float(values[1]))
-                elif len(values) == 3:
-                    existing_prop.property_type = 'vec3'
-                    existing_prop.valueC = (float(values[0]), float(values[1]), float(values[2]))
-                elif len(values) >= 4:
-                    existing_prop.property_type = 'vec4'
-                    existing_prop.valueD = (float(values[0]), float(values[1]),
-                                           float(values[2]), float(values[3]))
+                values = tuple([float(v) for v in values])
             except ValueError:
-                pass  # Skip properties that can't be parsed
+                continue  # Skip properties that can't be parsed
+            VALUE_SETTERS[len(values) - 1](existing_prop, values)
 
         shader_updated_count += 1
 
-    timestamp = read_timestamp(filepath)
+    timestamp = ini.timestamp
     timestamp_str = timestamp.strftime(TIMESTAMP_FORMAT) if timestamp else "unknown"
 
     msg_parts = [f"Imported {imported_count} sections"]
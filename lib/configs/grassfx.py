@@ -135,17 +135,16 @@ class AC_GrassFX(PropertyGroup):
 
         # Auto-detect occluding materials (all scene materials except grass materials)
         occluding_materials = []
+        grass_material_set = set(grass_material_names)
         import bpy
         for mat in bpy.data.materials:
-            # Skip hidden/excluded materials
-            if is_hidden_name(mat.name):
-                continue
-            # Skip grass materials
-            if mat.name in grass_material_names:
+            mat_name = mat.name
+            # Skip hidden/excluded materials and grass materials
+            if is_hidden_name(mat_name) or mat_name in grass_material_set:
                 continue
             # Check if material is actually used in the scene
             if mat.users > 0:
-                occluding_materials.append(mat.name)
+                occluding_materials.append(mat_name)
 
         result = {
             "GRASS_FX": {
@@ -208,3 +207,8 @@ class AC_GrassFX(PropertyGroup):
             self.shape_cut = float(data["SHAPE_CUT"])
         if "SHAPE_WIDTH" in data:
             self.shape_width = float(data["SHAPE_WIDTH"])
+
+
+classes = (
+    AC_GrassFXMaterial, AC_GrassFXOccludingMaterial, AC_GrassFX,
+)
@@ -1,5 +1,9 @@
 """Material PropertyGroups for KN5 export."""
 
+import sys
+from types import MappingProxyType
+from typing import NamedTuple
+
 from bpy.props import (BoolProperty, CollectionProperty, EnumProperty,
                        FloatProperty, FloatVectorProperty, IntProperty,
                        StringProperty)
@@ -7,6 +11,82 @@ from bpy.types import PropertyGroup
 
 from ...kn5.shader_defaults import get_shader_list
 
+# Dynamic enum items must stay referenced from Python while Blender uses them,
+# so the shader list is built once and the same tuple is handed back each call
+_SHADER_ITEMS_CACHE = None
+
+
+def _cached_shader_list(self, context):
+    """EnumProperty items callback returning the memoized shader list."""
+    global _SHADER_ITEMS_CACHE
+    if _SHADER_ITEMS_CACHE is None:
+        _SHADER_ITEMS_CACHE = tuple(get_shader_list(self, context))
+    return _SHADER_ITEMS_CACHE
+
+
+def invalidate_shader_list_cache():
+    """Rebuild the shader dropdown on next access (e.g. after reloading shader defaults)."""
+    global _SHADER_ITEMS_CACHE
+    _SHADER_ITEMS_CACHE = None
+
+
+_PROPERTY_TYPE_ITEMS = (
+    ("float", "Float", "Single scalar value (valueA)"),
+    ("vec2", "Vector2", "2-component vector (valueB)"),
+    ("vec3", "Vector3", "3-component vector (valueC)"),
+    ("vec4", "Vector4", "4-component vector (valueD)"),
+)
+
+_ALPHA_BLEND_ITEMS = (
+    ("0", "Opaque", "No transparency"),
+    ("1", "Alpha Blend", "Standard alpha blending"),
+    ("2", "Alpha to Coverage", "MSAA-based transparency"),
+)
+
+_DEPTH_MODE_ITEMS = (
+    ("0", "Depth Normal", "Normal depth writing"),
+    ("1", "Depth No Write", "Read depth but don't write"),
+    ("2", "Depth Off", "No depth testing"),
+)
+
+# Components per property_type; the RNA field holding them is indexed by count - 1
+_COMPONENT_COUNTS = MappingProxyType({"float": 1, "vec2": 2, "vec3": 3, "vec4": 4})
+_VALUE_FIELDS = ("valueA", "valueB", "valueC", "valueD")
+
+# Shared defaults for the vector value fields
+_ZERO2 = (0.0, 0.0)
+_ZERO3 = (0.0, 0.0, 0.0)
+_ZERO4 = (0.0, 0.0, 0.0, 0.0)
+
+
+def _value_setter(count):
+    """Build a setter storing `count` parsed floats as the matching property type."""
+    property_type = _PROPERTY_TYPE_ITEMS[count - 1][0]
+    if count == 1:
+        def set_value(prop, values):
+            prop.property_type = property_type
+            prop.valueA = values[0]
+    else:
+        field = _VALUE_FIELDS[count - 1]
+
+        def set_value(prop, values):
+            prop.property_type = property_type
+            setattr(prop, field, values)
+    return set_value
+
+
+# Setters indexed by component count - 1, built once at import
+VALUE_SETTERS = tuple(_value_setter(count) for count in (1, 2, 3, 4))
+
+
+class MaterialSnapshot(NamedTuple):
+    """Plain-Python copy of AC_MaterialSettings taken once per material."""
+    shader_name: str
+    alpha_blend_mode: int
+    alpha_tested: bool
+    depth_mode: int
+    shader_properties: tuple  # (name, property_type, components) per property
+
 
 class AC_ShaderProperty(PropertyGroup):
     """Shader property with up to 4 component values."""
@@ -19,12 +99,7 @@ class AC_ShaderProperty(PropertyGroup):
     property_type: EnumProperty(
         name="Property Type",
         description="Type of shader property (determines which value field to use)",
-        items=[
-            ("float", "Float", "Single scalar value (valueA)"),
-            ("vec2", "Vector2", "2-component vector (valueB)"),
-            ("vec3", "Vector3", "3-component vector (valueC)"),
-            ("vec4", "Vector4", "4-component vector (valueD)"),
-        ],
+        items=_PROPERTY_TYPE_ITEMS,
         default="float",
     )
     valueA: FloatProperty(
@@ -40,21 +115,38 @@ class AC_ShaderProperty(PropertyGroup):
         name="Value B",
         description="2-component vector (used when property_type='vec2')",
         size=2,
-        default=(0.0, 0.0),
+        default=_ZERO2,
     )
     valueC: FloatVectorProperty(
         name="Value C",
         description="3-component vector (used when property_type='vec3')",
         size=3,
-        default=(0.0, 0.0, 0.0),
+        default=_ZERO3,
     )
     valueD: FloatVectorProperty(
         name="Value D",
         description="4-component vector (used when property_type='vec4')",
         size=4,
-        default=(0.0, 0.0, 0.0, 0.0),
+        default=_ZERO4,
     )
 
+    @property
+    def component_count(self) -> int:
+        """Number of components property_type selects (1-4)."""
+        return _COMPONENT_COUNTS[self.property_type]
+
+    @property
+    def value_field(self) -> str:
+        """Name of the value field property_type selects."""
+        return _VALUE_FIELDS[self.component_count - 1]
+
+    def get_components(self) -> tuple:
+        """Return the 1-4 component values selected by property_type."""
+        count = self.component_count
+        if count == 1:
+            return (self.valueA,)
+        return tuple(getattr(self, _VALUE_FIELDS[count - 1]))
+
 
 class AC_MaterialSettings(PropertyGroup):
     """Assetto Corsa material settings for KN5 export."""
@@ -62,17 +154,13 @@ class AC_MaterialSettings(PropertyGroup):
     shader_name: EnumProperty(
         name="Shader",
         description="AC shader to use for this material",
-        items=get_shader_list,
+        items=_cached_shader_list,
         default=0,
     )
     alpha_blend_mode: EnumProperty(
         name="Alpha Blend Mode",
         description="How to handle alpha blending",
-        items=[
-            ("0", "Opaque", "No transparency"),
-            ("1", "Alpha Blend", "Standard alpha blending"),
-            ("2", "Alpha to Coverage", "MSAA-based transparency"),
-        ],
+        items=_ALPHA_BLEND_ITEMS,
         default="0",
     )
     alpha_tested: BoolProperty(
@@ -83,11 +171,7 @@ class AC_MaterialSettings(PropertyGroup):
     depth_mode: EnumProperty(
         name="Depth Mode",
         description="Depth buffer write mode",
-        items=[
-            ("0", "Depth Normal", "Normal depth writing"),
-            ("1", "Depth No Write", "Read depth but don't write"),
-            ("2", "Depth Off", "No depth testing"),
-        ],
+        items=_DEPTH_MODE_ITEMS,
         default="0",
     )
     shader_properties: CollectionProperty(
@@ -100,3 +184,39 @@ class AC_MaterialSettings(PropertyGroup):
         description="Active property in the list",
         default=-1,
     )
+
+    @property
+    def active_shader_property(self):
+        """Selected shader property, or None when the list has no valid selection."""
+        index = self.shader_properties_active
+        if 0 <= index < len(self.shader_properties):
+            return self.shader_properties[index]
+        return None
+
+    def properties_by_name(self) -> dict:
+        """Map shader property names to their items (first occurrence wins).
+
+        Built per call rather than cached: items can move when the collection
+        grows, and a rename does not change its length.
+        """
+        props = {}
+        for prop in self.shader_properties:
+            props.setdefault(prop.name, prop)
+        return props
+
+    def snapshot(self) -> MaterialSnapshot:
+        """Read every setting once so loops can work on plain Python values."""
+        return MaterialSnapshot(
+            self.shader_name,
+            int(self.alpha_blend_mode),
+            self.alpha_tested,
+            int(self.depth_mode),
+            # Property names come from a small set (ksDiffuse, ksAmbient, ...)
+            tuple((sys.intern(prop.name), prop.property_type, prop.get_components())
+                  for prop in self.shader_properties),
+        )
+
+
+classes = (
+    AC_ShaderProperty, AC_MaterialSettings,
+)
@@ -12,3 +12,8 @@ class AC_TextureSettings(PropertyGroup):
         description="AC shader texture slot (txDiffuse, txNormal, txDetail, etc.)",
         default="",  # No default - assigned during material validation based on connections
     )
+
+
+classes = (
+    AC_TextureSettings,
+)
@@ -7,72 +7,154 @@ from bpy.types import Material, Object, PropertyGroup
 from ...utils.helpers import is_hidden_name
 
 
+def _with_separators(*groups) -> tuple:
+    """Join preset groups into EnumProperty items with a separator between groups.
+
+    Separators use their position as enum value, matching the implicit
+    numbering of the plain items around them.
+    """
+    items = []
+    for group in groups:
+        if items:
+            items.append(("", "", "", "DISABLE", len(items)))
+        items.extend(group)
+    return tuple(items)
+
+
 # CSP Condition Presets - built-in conditions from common/conditions.ini
-CONDITION_PRESETS = [
-    ("NONE", "None", "No condition - always active"),
-    ("", "", "", "DISABLE", 1),  # Separator
+CONDITION_PRESETS = _with_separators(
+    (
+        ("NONE", "None", "No condition - always active"),
+    ),
     # Time-based (most common)
-    ("NIGHT_SMOOTH", "Night (Smooth)", "Activates at dusk with gradual fade (most common)"),
-    ("NIGHT_SHARP", "Night (Sharp)", "Activates at dusk with instant on/off"),
-    ("ALWAYS_ON", "Always On", "Constant activation"),
-    ("ALL_DAYS", "All Days", "Always on with optimized day/night intensity curve"),
-    ("", "", "", "DISABLE", 5),  # Separator
+    (
+        ("NIGHT_SMOOTH", "Night (Smooth)", "Activates at dusk with gradual fade (most common)"),
+        ("NIGHT_SHARP", "Night (Sharp)", "Activates at dusk with instant on/off"),
+        ("ALWAYS_ON", "Always On", "Constant activation"),
+        ("ALL_DAYS", "All Days", "Always on with optimized day/night intensity curve"),
+    ),
     # Early activation (tunnels/interiors)
-    ("SMOOTH_SUN_A", "Early Night (Smooth)", "Activates 5° above horizon - for tunnels/interiors"),
-    ("SHARP_SUN_A", "Early Night (Sharp)", "Activates 5° above horizon with instant response"),
-    ("", "", "", "DISABLE", 8),  # Separator
+    (
+        ("SMOOTH_SUN_A", "Early Night (Smooth)", "Activates 5° above horizon - for tunnels/interiors"),
+        ("SHARP_SUN_A", "Early Night (Sharp)", "Activates 5° above horizon with instant response"),
+    ),
     # Flashing/Effects
-    ("HAZARDS", "Hazards (4Hz)", "4Hz synced flashing - warning lights, beacons"),
-    ("FLAME_FLICKERING", "Flame Flickering", "5Hz irregular flickering - fire, candles, torches"),
-    ("", "", "", "DISABLE", 11),  # Separator
+    (
+        ("HAZARDS", "Hazards (4Hz)", "4Hz synced flashing - warning lights, beacons"),
+        ("FLAME_FLICKERING", "Flame Flickering", "5Hz irregular flickering - fire, candles, torches"),
+    ),
     # Heating simulation
-    ("NIGHT_SMOOTH_HEATING", "Night + Heating", "Gradual warm-up effect"),
-    ("NIGHT_SLOW_HEATING", "Night + Slow Heating", "Very slow warm-up (like sodium lamps)"),
-    ("", "", "", "DISABLE", 14),  # Separator
+    (
+        ("NIGHT_SMOOTH_HEATING", "Night + Heating", "Gradual warm-up effect"),
+        ("NIGHT_SLOW_HEATING", "Night + Slow Heating", "Very slow warm-up (like sodium lamps)"),
+    ),
     # Racing/Seasonal
-    ("RACING_FLAG", "Racing Flag", "Changes based on race flag state"),
-    ("SEASON_SUMMER_NORTH", "Summer (North)", "Peak intensity in summer months"),
-    ("SEASON_WINTER_NORTH", "Winter (North)", "Peak intensity in winter months"),
-    ("", "", "", "DISABLE", 18),  # Separator
-    ("CUSTOM", "Custom...", "Enter a custom condition string"),
-]
+    (
+        ("RACING_FLAG", "Racing Flag", "Changes based on race flag state"),
+        ("SEASON_SUMMER_NORTH", "Summer (North)", "Peak intensity in summer months"),
+        ("SEASON_WINTER_NORTH", "Winter (North)", "Peak intensity in winter months"),
+    ),
+    (
+        ("CUSTOM", "Custom...", "Enter a custom condition string"),
+    ),
+)
 
 # Condition presets for emissive materials (MATERIAL_ADJUSTMENT)
 # Some conditions cause glow to stop working, so we exclude them here
-EMISSIVE_CONDITION_PRESETS = [
-    ("NONE", "None", "No condition - always active"),
-    ("", "", "", "DISABLE", 1),  # Separator
+EMISSIVE_CONDITION_PRESETS = _with_separators(
+    (
+        ("NONE", "None", "No condition - always active"),
+    ),
     # Time-based (sharp transitions only - smooth ones break glow)
-    ("NIGHT_SHARP", "Night (Sharp)", "Activates at dusk with instant on/off"),
-    ("ALWAYS_ON", "Always On", "Constant activation"),
-    ("", "", "", "DISABLE", 4),  # Separator
+    (
+        ("NIGHT_SHARP", "Night (Sharp)", "Activates at dusk with instant on/off"),
+        ("ALWAYS_ON", "Always On", "Constant activation"),
+    ),
     # Early activation (tunnels/interiors)
-    ("SHARP_SUN_A", "Early Night (Sharp)", "Activates 5° above horizon with instant response"),
-    ("", "", "", "DISABLE", 6),  # Separator
+    (
+        ("SHARP_SUN_A", "Early Night (Sharp)", "Activates 5° above horizon with instant response"),
+    ),
     # Heating simulation
-    ("NIGHT_SMOOTH_HEATING", "Night + Heating", "Gradual warm-up effect"),
-    ("NIGHT_SLOW_HEATING", "Night + Slow Heating", "Very slow warm-up (like sodium lamps)"),
-    ("", "", "", "DISABLE", 9),  # Separator
+    (
+        ("NIGHT_SMOOTH_HEATING", "Night + Heating", "Gradual warm-up effect"),
+        ("NIGHT_SLOW_HEATING", "Night + Slow Heating", "Very slow warm-up (like sodium lamps)"),
+    ),
     # Racing/Seasonal
-    ("RACING_FLAG", "Racing Flag", "Changes based on race flag state"),
-    ("SEASON_SUMMER_NORTH", "Summer (North)", "Peak intensity in summer months"),
-    ("SEASON_WINTER_NORTH", "Winter (North)", "Peak intensity in winter months"),
-    ("", "", "", "DISABLE", 13),  # Separator
-    ("CUSTOM", "Custom...", "Enter a custom condition string"),
-]
+    (
+        ("RACING_FLAG", "Racing Flag", "Changes based on race flag state"),
+        ("SEASON_SUMMER_NORTH", "Summer (North)", "Peak intensity in summer months"),
+        ("SEASON_WINTER_NORTH", "Winter (North)", "Peak intensity in winter months"),
+    ),
+    (
+        ("CUSTOM", "Custom...", "Enter a custom condition string"),
+    ),
+)
+
+
+# MATERIAL_ADJUSTMENT off values (ksEmissive, ksAlphaRef) per off_value_mode
+_EMISSIVE_OFF_VALUES = {
+    "ORIGINAL": ("ORIGINAL", "ORIGINAL"),
+    "OFF": ("0, 0, 0", "0"),
+}
+
+
+# Material -> names of the non-hidden mesh objects using it, in bpy.data.objects
+# order. Built on first use and dropped whenever Blender data changes
+# (see clear_material_meshes_cache).
+_material_meshes_cache = [None]
+
+
+def clear_material_meshes_cache() -> None:
+    """Drop the cached material -> mesh object index."""
+    _material_meshes_cache[0] = None
+
+
+def _get_material_mesh_names(material) -> list:
+    """Names of the non-hidden mesh objects that use material (cached)."""
+    index = _material_meshes_cache[0]
+    if index is None:
+        index = _material_meshes_cache[0] = _build_material_mesh_index()
+    return index.get(material, [])
+
+
+def _build_material_mesh_index() -> dict:
+    """Walk bpy.data.objects once, mapping each material to its mesh objects."""
+    import bpy
+
+    index = {}
+    for obj in bpy.data.objects:
+        if obj.type != 'MESH':
+            continue
+        # Skip hidden/template objects
+        obj_name = obj.name
+        if is_hidden_name(obj_name):
+            continue
+        # Only add each object once per material
+        seen = set()
+        for slot in obj.material_slots:
+            material = slot.material
+            if material is not None and material not in seen:
+                seen.add(material)
+                index.setdefault(material, []).append(obj_name)
+    return index
+
+
+# (use_condition, condition) for presets that do not copy their identifier
+# into the condition string; None keeps the existing condition
+_PRESET_ACTIONS = {
+    "NONE": (False, ""),
+    "CUSTOM": (True, None),
+}
 
 
 def update_condition_preset(self, context):
     """Update the condition string when preset changes"""
-    if self.condition_preset == "NONE":
-        self.use_condition = False
-        self.condition = ""
-    elif self.condition_preset == "CUSTOM":
-        self.use_condition = True
-        # Keep existing condition string for custom
-    elif self.condition_preset:
-        self.use_condition = True
-        self.condition = self.condition_preset
+    preset = self.condition_preset
+    if preset:
+        use_condition, condition = _PRESET_ACTIONS.get(preset, (True, preset))
+        self.use_condition = use_condition
+        if condition is not None:
+            self.condition = condition
     # Sync to linked object if this is an AC_Light
     if hasattr(self, 'sync_csp_to_object'):
         self.sync_csp_to_object()
@@ -266,6 +348,26 @@ class AC_SunSettings(PropertyGroup):
         max=180
     )
 
+# Optional LIGHTING keys, grouped under the toggle that enables them:
+# (toggle, ((attribute, INI key, import default, parser), ...))
+_GLOBAL_LIGHTING_GROUPS = (
+    ("use_track_ambient_ground_mult", (
+        ("track_ambient_ground_mult", "TRACK_AMBIENT_GROUND_MULT", 0.5, float),
+    )),
+    ("use_multipliers", (
+        ("lit_mult", "LIT_MULT", 1, float),
+        ("specular_mult", "SPECULAR_MULT", 1, float),
+        ("car_lights_lit_mult", "CAR_LIGHTS_LIT_MULT", 1, float),
+    )),
+    ("use_bounced_light_mult", (
+        ("bounced_light_mult", "BOUNCED_LIGHT_MULT", (1, 1, 1, 1), None),
+    )),
+    ("use_terrain_shadows_threshold", (
+        ("terrain_shadows_threshold", "TERRAIN_SHADOWS_THRESHOLD", 0, float),
+    )),
+)
+
+
 class AC_GlobalLighting(PropertyGroup):
     enable_trees_lighting: BoolProperty(
         name="Enable Trees Lighting",
@@ -342,30 +444,20 @@ class AC_GlobalLighting(PropertyGroup):
 
     def from_dict(self, data: dict):
         self.enable_trees_lighting = data.get("ENABLE_TREES_LIGHTING", 0) == 1
-        self.use_track_ambient_ground_mult = "TRACK_AMBIENT_GROUND_MULT" in data
-        self.track_ambient_ground_mult = float(data.get("TRACK_AMBIENT_GROUND_MULT", 0.5))
-        self.use_multipliers = "LIT_MULT" in data
-        self.lit_mult = float(data.get("LIT_MULT", 1))
-        self.specular_mult = float(data.get("SPECULAR_MULT", 1))
-        self.car_lights_lit_mult = float(data.get("CAR_LIGHTS_LIT_MULT", 1))
-        self.use_bounced_light_mult = "BOUNCED_LIGHT_MULT" in data
-        self.bounced_light_mult = data.get("BOUNCED_LIGHT_MULT", (1, 1, 1, 1))
-        self.use_terrain_shadows_threshold = "TERRAIN_SHADOWS_THRESHOLD" in data
-        self.terrain_shadows_threshold = float(data.get("TERRAIN_SHADOWS_THRESHOLD", 0))
+        for toggle, fields in _GLOBAL_LIGHTING_GROUPS:
+            # A group is enabled when its first key is present
+            setattr(self, toggle, fields[0][1] in data)
+            for attr, key, default, parse in fields:
+                value = data.get(key, default)
+                setattr(self, attr, value if parse is None else parse(value))
 
     def to_dict(self) -> dict:
         data = {}
         data["ENABLE_TREES_LIGHTING"] = 1 if self.enable_trees_lighting else 0
-        if self.use_track_ambient_ground_mult:
-            data["TRACK_AMBIENT_GROUND_MULT"] = self.track_ambient_ground_mult
-        if self.use_multipliers:
-            data["LIT_MULT"] = self.lit_mult
-            data["SPECULAR_MULT"] = self.specular_mult
-            data["CAR_LIGHTS_LIT_MULT"] = self.car_lights_lit_mult
-        if self.use_bounced_light_mult:
-            data["BOUNCED_LIGHT_MULT"] = self.bounced_light_mult
-        if self.use_terrain_shadows_threshold:
-            data["TERRAIN_SHADOWS_THRESHOLD"] = self.terrain_shadows_threshold
+        for toggle, fields in _GLOBAL_LIGHTING_GROUPS:
+            if getattr(self, toggle):
+                for attr, key, _default, _parse in fields:
+                    data[key] = getattr(self, attr)
         return data
 
 
@@ -560,8 +652,9 @@ class AC_EmissiveMaterial(PropertyGroup):
             "ACTIVE": 1 if self.active else 0,
         }
 
-        if self.description:
-            data["DESCRIPTION"] = self.description
+        description = self.description
+        if description:
+            data["DESCRIPTION"] = description
 
         # Target: either MESHES or MATERIALS
         if self.use_mesh_filter and self.mesh:
@@ -569,32 +662,28 @@ class AC_EmissiveMaterial(PropertyGroup):
         elif self.material:
             data["MATERIALS"] = self.material.name
 
-        # ksEmissive property
-        r = int(self.emissive_color[0] * 255)
-        g = int(self.emissive_color[1] * 255)
-        b = int(self.emissive_color[2] * 255)
+        # ksEmissive property (color read from RNA once)
+        r, g, b = self.emissive_color
         data["KEY_0"] = "ksEmissive"
-        data["VALUE_0"] = f"{r}, {g}, {b}, {self.intensity}"
+        data["VALUE_0"] = f"{int(r * 255)}, {int(g * 255)}, {int(b * 255)}, {self.intensity}"
 
-        if self.use_condition:
-            if self.off_value_mode == "ORIGINAL":
-                data["VALUE_0_OFF"] = "ORIGINAL"
-            else:
-                data["VALUE_0_OFF"] = "0, 0, 0"
+        use_condition = self.use_condition
+        if use_condition:
+            off_values = _EMISSIVE_OFF_VALUES[self.off_value_mode]
+            data["VALUE_0_OFF"] = off_values[0]
 
         # Glow effect (ksAlphaRef)
         if self.use_glow_effect:
             data["KEY_1"] = "ksAlphaRef"
             data["VALUE_1"] = str(int(self.glow_amount))
-            if self.use_condition:
-                if self.off_value_mode == "ORIGINAL":
-                    data["VALUE_1_OFF"] = "ORIGINAL"
-                else:
-                    data["VALUE_1_OFF"] = "0"
+            if use_condition:
+                data["VALUE_1_OFF"] = off_values[1]
 
         # Condition
-        if self.use_condition and self.condition:
-            data["CONDITION"] = self.condition
+        if use_condition:
+            condition = self.condition
+            if condition:
+                data["CONDITION"] = condition
 
         return data
 
@@ -605,8 +694,6 @@ class AC_EmissiveMaterial(PropertyGroup):
         (instead of LIGHT_SERIES with multiple MESHES) ensures each light is
         placed at its mesh's origin rather than averaged between meshes.
         """
-        import bpy
-
         if not self.emit_light:
             return []
 
@@ -618,32 +705,24 @@ class AC_EmissiveMaterial(PropertyGroup):
             mesh_names.append(self.mesh.name)
         elif self.material:
             # No mesh specified - find all meshes using this material
-            for obj in bpy.data.objects:
-                if obj.type != 'MESH':
-                    continue
-                # Skip hidden/template objects
-                if is_hidden_name(obj.name):
-                    continue
-                # Check if object uses this material
-                for slot in obj.material_slots:
-                    if slot.material == self.material:
-                        mesh_names.append(obj.name)
-                        break  # Only add once per object
+            mesh_names.extend(_get_material_mesh_names(self.material))
 
         if not mesh_names:
             return []
 
-        # Build color string: R, G, B, intensity
-        r = int(self.emissive_color[0] * 255)
-        g = int(self.emissive_color[1] * 255)
-        b = int(self.emissive_color[2] * 255)
-        color_str = f"{r}, {g}, {b}, {self.light_intensity}"
+        # Build color string: R, G, B, intensity (color read from RNA once)
+        r, g, b = self.emissive_color
+        color_str = f"{int(r * 255)}, {int(g * 255)}, {int(b * 255)}, {self.light_intensity}"
+
+        # Vector properties read from RNA once
+        light_direction = self.light_direction
+        light_offset = self.light_offset
 
         # Build base light data (shared by all lights)
         base_data = {
             "ACTIVE": 1 if self.active else 0,
             "COLOR": color_str,
-            "DIRECTION": f"{self.light_direction[0]}, {self.light_direction[1]}, {self.light_direction[2]}",
+            "DIRECTION": ", ".join(map(str, light_direction)),
             "SPOT": self.light_spot,
             "SPOT_SHARPNESS": round(self.light_spot_sharpness, 2),
             "RANGE": round(self.light_range, 1),
@@ -653,8 +732,8 @@ class AC_EmissiveMaterial(PropertyGroup):
         }
 
         # Add offset if non-zero
-        if self.light_offset != (0, 0, 0):
-            base_data["OFFSET"] = f"{self.light_offset[0]}, {self.light_offset[1]}, {self.light_offset[2]}"
+        if any(light_offset):
+            base_data["OFFSET"] = ", ".join(map(str, light_offset))
 
         # Add condition if enabled
         if self.use_condition and self.condition:
@@ -669,15 +748,12 @@ class AC_EmissiveMaterial(PropertyGroup):
             base_data["SHADOWS"] = 1
 
         # Create individual light entry for each mesh
-        light_dicts = []
-        for mesh_name in mesh_names:
-            light_data = base_data.copy()
-            light_data["MESH"] = mesh_name
-            if self.description:
-                light_data["DESCRIPTION"] = f"{self.description} - {mesh_name}"
-            light_dicts.append(light_data)
-
-        return light_dicts
+        description = self.description
+        if description:
+            desc_prefix = f"{description} - "
+            return [{**base_data, "MESH": mesh_name, "DESCRIPTION": desc_prefix + mesh_name}
+                    for mesh_name in mesh_names]
+        return [{**base_data, "MESH": mesh_name} for mesh_name in mesh_names]
 
     def from_dict(self, data: dict):
         """Load from CSP ext_config.ini MATERIAL_ADJUSTMENT format"""
@@ -703,7 +779,8 @@ class AC_EmissiveMaterial(PropertyGroup):
         if "VALUE_0" in data and data.get("KEY_0") == "ksEmissive":
             value_str = data["VALUE_0"]
             if value_str != "ORIGINAL":
-                parts = [p.strip() for p in value_str.split(",")]
+                # float() ignores surrounding whitespace, so parts aren't stripped
+                parts = value_str.split(",")
                 if len(parts) >= 4:
                     self.emissive_color = (
                         float(parts[0]) / 255.0,
@@ -1283,7 +1360,7 @@ class AC_Light(PropertyGroup):
             self.direction = (forward.x, forward.y, forward.z)
 
     # CSP properties to sync between AC_Light and AC_CSPLightSettings
-    _CSP_SYNC_PROPERTIES = [
+    _CSP_SYNC_PROPERTIES = (
         # Shape settings
         'spot_sharpness',
         'range_gradient_offset',
@@ -1315,7 +1392,7 @@ class AC_Light(PropertyGroup):
         'shadows_clip_sphere',
         'shadows_exp_factor',
         'shadows_extra_blur',
-    ]
+    )
 
     def sync_csp_to_object(self):
         """Write CSP-specific settings to linked object's AC_CSP property.
@@ -1326,9 +1403,12 @@ class AC_Light(PropertyGroup):
         if not self.linked_object:
             return
 
+        # Only write values that differ; each RNA write tags the object for update
         csp = self.linked_object.AC_CSP
         for prop_name in self._CSP_SYNC_PROPERTIES:
-            setattr(csp, prop_name, getattr(self, prop_name))
+            value = getattr(self, prop_name)
+            if getattr(csp, prop_name) != value:
+                setattr(csp, prop_name, value)
 
     def sync_csp_from_object(self):
         """Read CSP-specific settings from linked object's AC_CSP property.
@@ -1347,8 +1427,11 @@ class AC_Light(PropertyGroup):
         # Temporarily unset linked_object so update callbacks don't overwrite
         self.linked_object = None
 
+        # Unchanged values are skipped so their update callbacks don't run
         for prop_name in self._CSP_SYNC_PROPERTIES:
-            setattr(self, prop_name, getattr(csp, prop_name))
+            value = getattr(csp, prop_name)
+            if getattr(self, prop_name) != value:
+                setattr(self, prop_name, value)
 
         # Restore linked_object
         self.linked_object = obj
@@ -1477,6 +1560,15 @@ class AC_Light(PropertyGroup):
         return data
 
 
+# Cached linked object name -> light index, per AC_Lighting (keyed by pointer).
+# Hits are verified before use, so a stale entry only costs a rescan.
+_linked_light_index = {}
+
+
+def invalidate_linked_light_index():
+    """Drop cached light lookups after lights are removed or reordered"""
+    _linked_light_index.clear()
+
 
 class AC_Lighting(PropertyGroup):
     sun: PointerProperty(
@@ -1521,6 +1613,22 @@ class AC_Lighting(PropertyGroup):
         description="Select material to add as emissive"
     )
 
+    def find_linked_light_index(self, obj: Object) -> int:
+        """Return the index of the light linked to obj, or -1 if none is"""
+        lights = self.lights
+        key = self.as_pointer()
+        index = _linked_light_index.get(key, {}).get(obj.name)
+        if index is not None and index < len(lights) and lights[index].linked_object == obj:
+            return index
+
+        # Miss or stale entry - rebuild the lookup with one pass over the lights
+        lookup = {}
+        for i, light in enumerate(lights):
+            if light.linked_object is not None:
+                lookup.setdefault(light.linked_object.name, i)
+        _linked_light_index[key] = lookup
+        return lookup.get(obj.name, -1)
+
     def from_dict(self, data: dict):
         self.sun.sun_pitch_angle = int(data.get("SUN_PITCH_ANGLE", 45))
         self.sun.sun_heading_angle = int(data.get("SUN_HEADING_ANGLE", 0))
@@ -1536,3 +1644,9 @@ class AC_Lighting(PropertyGroup):
                 "SUN_HEADING_ANGLE": self.sun.sun_heading_angle
             }
         }
+
+
+classes = (
+    AC_MeshList, AC_MaterialList, AC_PositionList, AC_DirectionList,
+    AC_CSPLightSettings, AC_SunSettings, AC_GlobalLighting, AC_EmissiveMaterial, AC_Light, AC_Lighting,
+)
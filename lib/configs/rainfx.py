@@ -77,3 +77,8 @@ class AC_RainFX(PropertyGroup):
         self.rough_materials = data.get("ROUGH_MATERIALS", "")
         self.lines_materials = data.get("LINES_MATERIALS", "")
         self.lines_filter_materials = data.get("LINES_FILTER_MATERIALS", "")
+
+
+classes = (
+    AC_RainFX,
+)
@@ -230,3 +230,8 @@ class AC_Surface(PropertyGroup):
         self.ext_perlin_noise = bool(int(data.get("_EXT_PERLIN_NOISE", 0)))
         self.ext_perlin_octaves = int(data.get("_EXT_PERLIN_OCTAVES", 1))
         self.ext_perlin_persistence = float(data.get("_EXT_PERLIN_PERSISTENCE", 0.5))
+
+
+classes = (
+    AC_Surface,
+)
@@ -157,3 +157,8 @@ class AC_Track(PropertyGroup):
         self.width = data["width"]
         self.run = self.get_run_mode_key(data['run']) if data["run"] in ["a-b", "b-a", "clockwise", "counter clockwise"] else "CW"
         self.pitboxes = int(data["pitboxes"])
+
+
+classes = (
+    AC_Track,
+)
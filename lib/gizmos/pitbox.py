@@ -390,3 +390,8 @@ class AC_GizmoGroup(GizmoGroup):
             g.color_highlight = prefs.ab_finish_color[:3]
             g.alpha_highlight = prefs.ab_finish_color[3]
             g.update(ab_finish_gates[0].location, ab_finish_gates[1].location)
+
+
+classes = (
+    AC_SelectGizmoObject, AC_GizmoPitbox, AC_GizmoStartPos, AC_GizmoGate, AC_GizmoGroup,
+)
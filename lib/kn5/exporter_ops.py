@@ -711,3 +711,8 @@ class ExportKN5(bpy.types.Operator, ExportHelper):
 
 def menu_func(self, context):
     self.layout.operator(ExportKN5.bl_idname, text="Assetto Corsa (.kn5)")
+
+
+classes = (
+    AC_ContinueSmartExport, ReportOperator, CopyClipboardButtonOperator, ExportKN5,
+)
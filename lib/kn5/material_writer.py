@@ -17,6 +17,8 @@
 import numbers
 import os
 import re
+import struct
+import sys
 from .utils import (
     get_active_material_texture_slot,
     get_texture_nodes,
@@ -33,6 +35,10 @@ MATERIALS = "materials"
 PROPERTIES = "properties"
 TEXTURES = "textures"
 
+# Fixed-size parts of a material record, each written with a single pack call
+_MATERIAL_MODES = struct.Struct("<B?i")  # alphaBlendMode, alphaTested, depthMode
+_PROPERTY_VALUES = struct.Struct("<f2f3f4f")  # valueA, valueB, valueC, valueD
+
 
 class MaterialWriter(KN5Writer):
     def __init__(self, file, context, settings, warnings, texture_name_mapping=None):
@@ -57,9 +63,7 @@ class MaterialWriter(KN5Writer):
     def _write_material(self, material):
         self.write_string(material.name)
         self.write_string(material.shaderName)
-        self.write_byte(material.alphaBlendMode)
-        self.write_bool(material.alphaTested)
-        self.write_int(material.depthMode)
+        self.file.write(_MATERIAL_MODES.pack(material.alphaBlendMode, material.alphaTested, material.depthMode))
         self.write_uint(len(material.shaderProperties))
         for property_name in material.shaderProperties:
             self._write_material_property(material.shaderProperties[property_name])
@@ -73,10 +77,7 @@ class MaterialWriter(KN5Writer):
 
     def _write_material_property(self, prop):
         self.write_string(prop.name)
-        self.write_float(prop.valueA)
-        self.write_vector2(prop.valueB)
-        self.write_vector3(prop.valueC)
-        self.write_vector4(prop.valueD)
+        self.file.write(_PROPERTY_VALUES.pack(prop.valueA, *prop.valueB, *prop.valueC, *prop.valueD))
 
     def _fill_available_materials(self):
         self.available_materials = {}
@@ -103,6 +104,8 @@ class MaterialWriter(KN5Writer):
 
 
 class ShaderProperty:
+    __slots__ = ("name", "valueA", "valueB", "valueC", "valueD")
+
     def __init__(self, name):
         self.name = name
         self.valueA = 0.0
@@ -111,10 +114,11 @@ class ShaderProperty:
         self.valueD = (0.0, 0.0, 0.0, 0.0)
 
     def fill(self, prop):
+        # Copy out of RNA so writing the material never reads Blender data
         self.valueA = prop.valueA
-        self.valueB = prop.valueB
-        self.valueC = prop.valueC
-        self.valueD = prop.valueD
+        self.valueB = tuple(prop.valueB)
+        self.valueC = tuple(prop.valueC)
+        self.valueD = tuple(prop.valueD)
 
 
 class MaterialProperties:
@@ -133,11 +137,13 @@ class MaterialProperties:
         ac_mat = material.AC_Material
         properties = {}
         for shader_property in ac_mat.shader_properties:
-            new_property = ShaderProperty(shader_property.name)
+            # Names repeat across materials; interned keys hash and compare by identity
+            property_name = sys.intern(shader_property.name)
+            new_property = ShaderProperty(property_name)
             new_property.fill(shader_property)
-            properties[shader_property.name] = new_property
+            properties[property_name] = new_property
         # Add a default ksDiffuse value for all objects without any properties set
-        if not properties and ac_mat.shader_name == "ksPerPixel":
+        if not properties and self.shaderName == "ksPerPixel":
             new_property = ShaderProperty("ksDiffuse")
             new_property.valueA = 0.4
             properties[new_property.name] = new_property
@@ -119,7 +119,7 @@ class NodeWriter(KN5Writer):
 
         # Blend with horizontal component of original normal for variation
         # This gives natural-looking shading variation across the tree
-        orig_horiz_len = math.sqrt(vertex_normal[0]**2 + vertex_normal[2]**2)
+        orig_horiz_len = math.hypot(vertex_normal[0], vertex_normal[2])
 
         if orig_horiz_len > 0.001:
             # Normalize horizontal component
@@ -136,7 +136,7 @@ class NodeWriter(KN5Writer):
             nx, ny, nz = 0.0, 1.0, 0.0
 
         # Normalize the result
-        length = math.sqrt(nx*nx + ny*ny + nz*nz)
+        length = math.hypot(nx, ny, nz)
         if length > 0.001:
             nx, ny, nz = nx/length, ny/length, nz/length
         else:
@@ -573,11 +573,7 @@ class NodeWriter(KN5Writer):
         # Calculate actual radius as max distance from center to any vertex
         sphere_radius = 0.0
         for vertex in vertices:
-            co = vertex.co
-            dx = co[0] - sphere_center[0]
-            dy = co[1] - sphere_center[1]
-            dz = co[2] - sphere_center[2]
-            dist = (dx * dx + dy * dy + dz * dz) ** 0.5
+            dist = math.dist(vertex.co, sphere_center)
             if dist > sphere_radius:
                 sphere_radius = dist
         self.write_vector3(sphere_center)
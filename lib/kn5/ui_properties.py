@@ -131,3 +131,8 @@ class KN5_PT_TexturePanel(bpy.types.Panel):
     def draw(self, context):
         ac_node = context.selected_nodes[0].AC_Texture
         self.layout.prop(ac_node, "shader_input_name")
+
+
+classes = (
+    NodeProperties, KN5_PT_NodePanel, MaterialProperties, TextureProperties,
+)
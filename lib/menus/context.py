@@ -46,3 +46,8 @@ def surface_menu(self, context):
     layout.operator("ac.assign_phys_prop")
     layout.separator()
     layout.menu("WM_MT_ObjectSetup")
+
+
+classes = (
+    WM_MT_AssignSurface, WM_MT_ObjectSetup,
+)
@@ -33,3 +33,8 @@ class AC_ToggleAudio(Operator):
         audio_source = settings.audio_sources[self.target]
         audio_source.expand = not audio_source.expand
         return {'FINISHED'}
+
+
+classes = (
+    AC_AddAudioSource, AC_ToggleAudio,
+)
@@ -200,7 +200,7 @@ class AC_BulkEditProperties(Operator):
             self.report({'ERROR'}, "No materials selected")
             return {'CANCELLED'}
 
-        material_names = bulk.selected_material_names.split("|")
+        material_names = bulk.get_selected_material_names()
 
         # Find common properties
         common = find_common_properties(material_names)
@@ -227,7 +227,7 @@ class AC_BulkEditProperties(Operator):
         settings = context.scene.AC_Settings
         bulk = settings.bulk_edit
 
-        material_names = bulk.selected_material_names.split("|")
+        material_names = bulk.get_selected_material_names()
 
         layout.label(text=f"Editing {len(material_names)} materials")
         layout.label(text=f"{len(bulk.common_properties)} common properties found")
@@ -252,7 +252,7 @@ class AC_BulkEditProperties(Operator):
         settings = context.scene.AC_Settings
         bulk = settings.bulk_edit
 
-        material_names = bulk.selected_material_names.split("|")
+        material_names = bulk.get_selected_material_names()
         updated_count = 0
 
         for mat_name in material_names:
@@ -262,21 +262,21 @@ class AC_BulkEditProperties(Operator):
 
             ac_mat = mat.AC_Material
 
-            # Update each common property
+            # Update each common property (one name lookup per property)
+            mat_props = ac_mat.properties_by_name()
             for bulk_prop in bulk.common_properties:
-                # Find matching property in material
-                for mat_prop in ac_mat.shader_properties:
-                    if mat_prop.name == bulk_prop.name:
-                        # Copy values based on type
-                        if bulk_prop.property_type == "float":
-                            mat_prop.valueA = bulk_prop.valueA
-                        elif bulk_prop.property_type == "vec2":
-                            mat_prop.valueB = bulk_prop.valueB
-                        elif bulk_prop.property_type == "vec3":
-                            mat_prop.valueC = bulk_prop.valueC
-                        elif bulk_prop.property_type == "vec4":
-                            mat_prop.valueD = bulk_prop.valueD
-                        break
+                mat_prop = mat_props.get(bulk_prop.name)
+                if mat_prop is None:
+                    continue
+                # Copy values based on type
+                if bulk_prop.property_type == "float":
+                    mat_prop.valueA = bulk_prop.valueA
+                elif bulk_prop.property_type == "vec2":
+                    mat_prop.valueB = bulk_prop.valueB
+                elif bulk_prop.property_type == "vec3":
+                    mat_prop.valueC = bulk_prop.valueC
+                elif bulk_prop.property_type == "vec4":
+                    mat_prop.valueD = bulk_prop.valueD
 
             updated_count += 1
 
@@ -1,6 +1,8 @@
 from bpy.props import IntProperty, StringProperty
 from bpy.types import Operator
 
+from ...configs.ext_config import invalidate_sections_cache
+
 
 class AC_AddGlobalExtension(Operator):
     """Add a global extension to the project"""
@@ -11,6 +13,7 @@ class AC_AddGlobalExtension(Operator):
         settings = context.scene.AC_Settings # type: ignore
         ext_group = settings.global_extensions.add()
         ext_group.name = "_EXT"
+        invalidate_sections_cache()
         return {'FINISHED'}
 
 class AC_RemoveGlobalExtension(Operator):
@@ -29,6 +32,7 @@ class AC_RemoveGlobalExtension(Operator):
         for i, ext in enumerate(settings.global_extensions):
             if ext.name == self.name:
                 settings.global_extensions.remove(i)
+                invalidate_sections_cache()
                 break
         return {'FINISHED'}
 
@@ -62,6 +66,7 @@ class AC_AddGlobalExtensionItem(Operator):
         ext_group = next((ext for ext in settings.global_extensions if ext.name == self.name), None)
         if ext_group:
             ext_group.items.add()
+            invalidate_sections_cache()
         return {'FINISHED'}
 
 class AC_RemoveGlobalExtensionItem(Operator):
@@ -81,4 +86,11 @@ class AC_RemoveGlobalExtensionItem(Operator):
         settings = context.scene.AC_Settings # type: ignore
         ext_group = settings.global_extensions[self.ext_index]
         ext_group.items.remove(self.item_index)
+        invalidate_sections_cache()
         return {'FINISHED'}
+
+
+classes = (
+    AC_AddGlobalExtension, AC_RemoveGlobalExtension, AC_ToggleGlobalExtension,
+    AC_AddGlobalExtensionItem, AC_RemoveGlobalExtensionItem,
+)
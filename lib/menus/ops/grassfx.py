@@ -3,6 +3,7 @@
 import bpy
 from bpy.types import Operator
 from ....utils.helpers import is_hidden_name
+from ...configs.ext_config import invalidate_sections_cache
 
 
 class AC_AddGrassFXMaterial(Operator):
@@ -30,6 +31,7 @@ class AC_AddGrassFXMaterial(Operator):
         # Add material
         mat_entry = grassfx.materials.add()
         mat_entry.material_name = material.name
+        invalidate_sections_cache()
 
         self.report({'INFO'}, f"Added '{material.name}' to GrassFX")
         return {'FINISHED'}
@@ -52,6 +54,7 @@ class AC_RemoveGrassFXMaterial(Operator):
         for i, mat in enumerate(grassfx.materials):
             if mat.material_name == self.material_name:
                 grassfx.materials.remove(i)
+                invalidate_sections_cache()
                 self.report({'INFO'}, f"Removed '{self.material_name}' from GrassFX")
                 return {'FINISHED'}
 
@@ -70,6 +73,7 @@ class AC_ClearGrassFXMaterials(Operator):
         settings = context.scene.AC_Settings
         count = len(settings.grassfx.materials)
         settings.grassfx.materials.clear()
+        invalidate_sections_cache()
 
         self.report({'INFO'}, f"Cleared {count} material(s) from GrassFX")
         return {'FINISHED'}
@@ -101,6 +105,7 @@ class AC_AutoDetectGrassFXMaterials(Operator):
                     found_materials.append(mat.name)
 
         if found_materials:
+            invalidate_sections_cache()
             self.report({'INFO'}, f"Added {len(found_materials)} grass material(s) to GrassFX")
         else:
             self.report({'INFO'}, "No new ksGrass materials found")
@@ -134,6 +139,7 @@ class AC_AddOccludingMaterial(Operator):
         # Add material
         mat_entry = grassfx.occluding_materials.add()
         mat_entry.material_name = material.name
+        invalidate_sections_cache()
 
         self.report({'INFO'}, f"Added '{material.name}' as occluding material")
         return {'FINISHED'}
@@ -156,6 +162,7 @@ class AC_RemoveOccludingMaterial(Operator):
         for i, mat in enumerate(grassfx.occluding_materials):
             if mat.material_name == self.material_name:
                 grassfx.occluding_materials.remove(i)
+                invalidate_sections_cache()
                 self.report({'INFO'}, f"Removed '{self.material_name}' from occluding materials")
                 return {'FINISHED'}
 
@@ -174,6 +181,13 @@ class AC_ClearOccludingMaterials(Operator):
         settings = context.scene.AC_Settings
         count = len(settings.grassfx.occluding_materials)
         settings.grassfx.occluding_materials.clear()
+        invalidate_sections_cache()
 
         self.report({'INFO'}, f"Cleared {count} occluding material(s)")
         return {'FINISHED'}
+
+
+classes = (
+    AC_AddGrassFXMaterial, AC_RemoveGrassFXMaterial, AC_ClearGrassFXMaterials, AC_AutoDetectGrassFXMaterials,
+    AC_AddOccludingMaterial, AC_RemoveOccludingMaterial, AC_ClearOccludingMaterials,
+)
@@ -531,3 +531,8 @@ class AC_GeneratePreview(Operator):
             context.scene.render.resolution_y = original_render_settings['resolution_y']
             context.scene.render.filepath = original_render_settings['filepath']
             context.scene.render.image_settings.file_format = original_render_settings['image_format']
+
+
+classes = (
+    AC_GenerateMap, AC_GeneratePreview, AC_CreatePreviewCamera,
+)
@@ -8,6 +8,8 @@ from bpy.props import IntProperty
 
 from ....utils.helpers import parse_ini_file
 from ....utils.constants import DEFAULT_LIGHT_TYPE
+from ...configs.ext_config import invalidate_sections_cache
+from ...configs.lighting import invalidate_linked_light_index
 
 
 # ============================================================================
@@ -175,6 +177,9 @@ def scan_and_sync_lights(context, lighting):
     for i in reversed(indices_to_remove):
         lighting.lights.remove(i)
         removed_count += 1
+    if removed_count:
+        invalidate_linked_light_index()
+        invalidate_sections_cache()
 
     return added_count, removed_count
 
@@ -329,6 +334,8 @@ class AC_RemoveLight(Operator):
         if is_valid_index(idx, len(lighting.lights)):
             light_name = lighting.lights[idx].description
             lighting.lights.remove(idx)
+            invalidate_linked_light_index()
+            invalidate_sections_cache()
 
             # Adjust active index
             lighting.active_light_index = adjust_active_index(lighting.active_light_index, len(lighting.lights))
@@ -534,6 +541,8 @@ class AC_MoveLightUp(Operator):
 
         lighting.lights.move(idx, idx - 1)
         lighting.active_light_index -= 1
+        invalidate_linked_light_index()
+        invalidate_sections_cache()
 
         return {'FINISHED'}
 
@@ -558,6 +567,8 @@ class AC_MoveLightDown(Operator):
 
         lighting.lights.move(idx, idx + 1)
         lighting.active_light_index += 1
+        invalidate_linked_light_index()
+        invalidate_sections_cache()
 
         return {'FINISHED'}
 
@@ -982,6 +993,7 @@ class AC_RemoveEmissiveMaterial(Operator):
             emissive = lighting.emissive_materials[idx]
             name = emissive.description or (emissive.material.name if emissive.material else "Unknown")
             lighting.emissive_materials.remove(idx)
+            invalidate_sections_cache()
 
             # Adjust active index
             lighting.active_emissive_index = adjust_active_index(lighting.active_emissive_index, len(lighting.emissive_materials))
@@ -1033,6 +1045,7 @@ class AC_ClearEmissiveMaterials(Operator):
 
         count = len(lighting.emissive_materials)
         lighting.emissive_materials.clear()
+        invalidate_sections_cache()
         lighting.active_emissive_index = 0
 
         self.report({'INFO'}, f"Cleared {count} emissive material(s)")
@@ -1104,3 +1117,14 @@ class AC_SelectEmissiveObject(Operator):
             return {'CANCELLED'}
 
         return {'FINISHED'}
+
+
+classes = (
+    AC_AddLight, AC_AddLightFromSelection, AC_AddLightAtCursor, AC_RemoveLight, AC_ToggleLightShadows, AC_DuplicateLight,
+    AC_SyncLightFromObject, AC_SyncAllLights, AC_SelectLightObject,
+    AC_MoveLightUp, AC_MoveLightDown,
+    AC_AddBlenderSpotLight, AC_SyncFromBlenderLight, AC_AddLightFromBlenderLights,
+    AC_ScanLights, AC_SyncAllFromBlender, AC_ExportAndUpdateLights,
+    AC_AddEmissiveMaterial, AC_AddEmissiveFromMesh, AC_RemoveEmissiveMaterial,
+    AC_ToggleEmissiveShadows, AC_ClearEmissiveMaterials, AC_SelectEmissiveObject,
+)
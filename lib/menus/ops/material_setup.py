@@ -374,3 +374,8 @@ class AC_ResetShaderDefaults(Operator):
 
         self.report({'INFO'}, f"Reset properties to {shader_name} defaults")
         return {'FINISHED'}
+
+
+classes = (
+    AC_AutoAssignTextureSlots, AC_SetupNormalMap, AC_ApplyShaderDefaults, AC_ResetShaderDefaults,
+)
@@ -301,3 +301,8 @@ class AC_SetupAsTree(Operator):
             if input_socket.is_linked:
                 for link in input_socket.links:
                     self.trace_and_assign_texture(link.from_node, slot_name, visited)
+
+
+classes = (
+    AC_SetupAsGrass, AC_SetupAsStandard, AC_SetupAsTree, AC_AutoSetupObjects,
+)
@@ -158,15 +158,9 @@ def collect_material_data(context=None, visible_only: bool = True) -> list[dict]
                 'type': prop.property_type,
             }
 
-            # Get value based on type
-            if prop.property_type == 'float':
-                prop_data['value'] = prop.valueA
-            elif prop.property_type == 'vec2':
-                prop_data['value'] = (prop.valueB[0], prop.valueB[1])
-            elif prop.property_type == 'vec3':
-                prop_data['value'] = (prop.valueC[0], prop.valueC[1], prop.valueC[2])
-            elif prop.property_type == 'vec4':
-                prop_data['value'] = (prop.valueD[0], prop.valueD[1], prop.valueD[2], prop.valueD[3])
+            # Get value based on type (floats stay scalar)
+            value = prop.get_components()
+            prop_data['value'] = value[0] if prop.property_type == 'float' else value
 
             material_info['properties'].append(prop_data)
 
@@ -270,14 +264,7 @@ def update_material_config(working_dir: str) -> tuple[bool, str, int]:
 
         props = {}
         for prop in ac_mat.shader_properties:
-            if prop.property_type == 'float':
-                props[prop.name] = format_float(prop.valueA)
-            elif prop.property_type == 'vec2':
-                props[prop.name] = f"{format_float(prop.valueB[0])}, {format_float(prop.valueB[1])}"
-            elif prop.property_type == 'vec3':
-                props[prop.name] = f"{format_float(prop.valueC[0])}, {format_float(prop.valueC[1])}, {format_float(prop.valueC[2])}"
-            elif prop.property_type == 'vec4':
-                props[prop.name] = f"{format_float(prop.valueD[0])}, {format_float(prop.valueD[1])}, {format_float(prop.valueD[2])}, {format_float(prop.valueD[3])}"
+            props[prop.name] = ", ".join(map(format_float, prop.get_components()))
 
         material_props[material.name] = props
 
@@ -1054,3 +1041,12 @@ class AC_ShowPreflightErrors(Operator):
             footer = layout.row()
             footer.scale_y = 1.3
             footer.operator("ac.autofix_preflight", text="Attempt to Fix Issues", icon="TOOL_SETTINGS")
+
+
+classes = (
+    AC_AutofixPreflight, AC_ValidateAll, AC_UpdateMaterialConfig, AC_ScanForIssues, AC_ShowPreflightErrors,
+    AC_SaveSettings,
+    AC_SaveSurfaces, AC_SaveExtensions, AC_SaveLighting, AC_SaveAudio, AC_SaveTrackData,
+    AC_AddStart, AC_AddHotlapStart, AC_AddPitbox, AC_AddTimeGate, AC_AddABStartGate, AC_AddABFinishGate,
+    AC_AddAudioEmitter, AC_AddRaceSetup,
+)
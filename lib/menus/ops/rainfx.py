@@ -200,3 +200,8 @@ class AC_ToggleRainFX(Operator):
         status = "enabled" if rainfx.enabled else "disabled"
         self.report({"INFO"}, f"RainFX {status}")
         return {"FINISHED"}
+
+
+classes = (
+    AC_AutoDetectRainFXMaterials, AC_ClearRainFXMaterials, AC_ToggleRainFX,
+)
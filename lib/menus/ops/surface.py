@@ -257,3 +257,10 @@ def remove_existing_prefix(name: str) -> str:
             return match.group(3)
         return ''
     return name
+
+
+classes = (
+    AC_InitSurfaces, AC_RefreshSurfaces, AC_AddSurface, AC_RemoveSurface, AC_ToggleSurface,
+    AC_AssignSurface, AC_SelectAllSurfaces, AC_AssignWall, AC_AssignPhysProp,
+    AC_AddSurfaceExt, AC_DeleteSurfaceExt,
+)
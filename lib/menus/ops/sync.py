@@ -334,3 +334,9 @@ class AC_ImportExtConfig(Operator):
         else:
             self.report({'ERROR'}, message)
             return {'CANCELLED'}
+
+
+classes = (
+    AC_ExtConfigSyncCheck, AC_ExtConfigSyncDialog, AC_ExtConfigSyncAction, AC_ExtConfigSyncCancel,
+    AC_ExtConfigViewDiff, AC_ImportExtConfig,
+)
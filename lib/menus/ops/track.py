@@ -125,3 +125,9 @@ class AC_SelectByName(Operator):
             ob.select_set(True)
             context.view_layer.objects.active = ob
         return {'FINISHED'}
+
+
+classes = (
+    AC_AddTag, AC_RemoveTag, AC_AddGeoTag, AC_RemoveGeoTag, AC_ToggleTag, AC_ToggleGeoTag,
+    AC_SelectByName,
+)
@@ -222,3 +222,8 @@ class AC_ExportTreeList(Operator):
 
         # Show dialog to enter filename
         return context.window_manager.invoke_props_dialog(self)
+
+
+classes = (
+    AC_ExportTreeList,
+)
@@ -2,6 +2,8 @@
 
 from bpy.types import Operator, Panel, UIList
 
+from ...configs.ext_config import invalidate_sections_cache
+
 
 class AC_UL_ShaderProperties(UIList):
     """UI List for shader properties."""
@@ -55,8 +57,8 @@ class PROPERTIES_PT_AC_Material(Panel):
             )
 
             # Show active property editor
-            if 0 <= ac_mat.shader_properties_active < len(ac_mat.shader_properties):
-                active_prop = ac_mat.shader_properties[ac_mat.shader_properties_active]
+            active_prop = ac_mat.active_shader_property
+            if active_prop is not None:
                 col = box.column(align=True)
                 col.prop(active_prop, "name")
                 col.prop(active_prop, "property_type")
@@ -151,7 +153,13 @@ class AC_RemoveShaderProperty(Operator):
             return {'CANCELLED'}
 
         ac_mat = material.AC_Material
-        if 0 <= ac_mat.shader_properties_active < len(ac_mat.shader_properties):
+        if ac_mat.active_shader_property is not None:
             ac_mat.shader_properties.remove(ac_mat.shader_properties_active)
+            invalidate_sections_cache()
             ac_mat.shader_properties_active = max(0, ac_mat.shader_properties_active - 1)
         return {'FINISHED'}
+
+
+classes = (
+    AC_UL_ShaderProperties, PROPERTIES_PT_AC_Material, AC_AddShaderProperty, AC_RemoveShaderProperty,
+)
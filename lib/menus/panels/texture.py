@@ -32,3 +32,8 @@ class NODE_PT_AC_Texture(Panel):
         box.label(text="• txNormal (Normal Map)")
         box.label(text="• txDetail (Detail/Specular)")
         box.label(text="• txVariation (Grass variation)")
+
+
+classes = (
+    NODE_PT_AC_Texture,
+)
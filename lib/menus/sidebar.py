@@ -1281,22 +1281,38 @@ class VIEW3D_PT_AC_ShaderProperties(Panel):
             )
 
             # Show value editor for selected property
-            if 0 <= ac_mat.shader_properties_active < len(ac_mat.shader_properties):
-                active_prop = ac_mat.shader_properties[ac_mat.shader_properties_active]
-                prop_type = active_prop.property_type
-
+            active_prop = ac_mat.active_shader_property
+            if active_prop is not None:
                 # Display appropriate value field based on property type
-                if prop_type == "float":
-                    layout.prop(active_prop, "valueA", text="Value")
-                elif prop_type == "vec2":
-                    layout.prop(active_prop, "valueB", text="Value")
-                elif prop_type == "vec3":
-                    layout.prop(active_prop, "valueC", text="Value")
-                elif prop_type == "vec4":
-                    layout.prop(active_prop, "valueD", text="Value")
+                layout.prop(active_prop, active_prop.value_field, text="Value")
         else:
             layout.label(text="No shader properties", icon='INFO')
 
         # Reset to defaults button
         layout.separator()
         layout.operator("ac.reset_shader_defaults", icon='LOOP_BACK')
+
+
+classes = (
+    AC_ClearMaterialSearch, AC_ScanMaterials,
+    AC_UL_Tags, AC_UL_Extensions, AC_UL_SurfaceExtensions, AC_UL_GrassFXMaterials, AC_UL_Materials,
+    AC_UL_Lights, AC_UL_EmissiveMaterials,
+    # Main panels (parent panels must be registered first)
+    VIEW3D_PT_AC_Setup,
+    VIEW3D_PT_AC_SurfaceTools,
+    VIEW3D_PT_AC_Surfaces,  # subpanel of SurfaceTools
+    VIEW3D_PT_AC_Objects,
+    VIEW3D_PT_AC_Sidebar_Extra,
+    VIEW3D_PT_AC_Export,
+    VIEW3D_PT_AC_TrackImages,  # subpanel of Export
+    # Extra subpanels
+    VIEW3D_PT_AC_Sidebar_GrassFX,
+    VIEW3D_PT_AC_Sidebar_RainFX,
+    VIEW3D_PT_AC_Sidebar_TreeFX,
+    VIEW3D_PT_AC_Sidebar_AILines,
+    VIEW3D_PT_AC_Sidebar_CSPLights,
+    VIEW3D_PT_AC_Sidebar_EmissiveMaterials,
+    VIEW3D_PT_AC_MaterialEditor,
+    VIEW3D_PT_AC_MaterialProperties,  # subpanel of MaterialEditor
+    VIEW3D_PT_AC_ShaderProperties,    # subpanel of MaterialEditor
+)
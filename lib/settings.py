@@ -932,3 +932,8 @@ class AC_Settings(PropertyGroup):
 
 def get_settings() -> AC_Settings:
     return bpy.context.scene.AC_Settings  # type: ignore
+
+
+classes = (
+    KN5_MeshSettings, ExportSettings, AC_Settings,
+)
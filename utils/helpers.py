@@ -323,10 +323,23 @@ def is_object_visible(obj, scene) -> bool:
     return False
 
 
+# get_visible_materials results per (scene, view layer). Cleared by the
+# addon's depsgraph_update_post handler whenever Blender data changes.
+_visible_materials_cache = {}
+
+
+def clear_visible_materials_cache() -> None:
+    """Drop cached get_visible_materials results."""
+    _visible_materials_cache.clear()
+
+
 def get_visible_materials(context) -> set:
     """
     Get materials that are used by visible objects in the scene.
 
+    The scan is cached per scene and view layer until Blender data changes
+    (see clear_visible_materials_cache); each call returns a new set.
+
     A material is considered "visible" if:
     1. It is used by at least one object (not orphaned)
     2. That object is visible in the viewport
@@ -339,6 +352,16 @@ def get_visible_materials(context) -> set:
     Returns:
         Set of material names that are visible
     """
+    key = (context.scene.as_pointer(), context.view_layer.as_pointer())
+    visible_materials = _visible_materials_cache.get(key)
+    if visible_materials is None:
+        visible_materials = frozenset(_scan_visible_materials(context))
+        _visible_materials_cache[key] = visible_materials
+    return set(visible_materials)
+
+
+def _scan_visible_materials(context) -> set:
+    """Collect the names of materials on visible objects (uncached)."""
     import bpy
 
     visible_materials = set()